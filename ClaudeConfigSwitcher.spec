@@ -0,0 +1,91 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for Claude Code Configuration Switcher.
+
+Built via `uv run python scripts/build.py`, which passes --upx-dir when UPX
+is available.
+"""
+
+import pkgutil
+import platform
+import sys
+from pathlib import Path
+
+import customtkinter
+import tkinter
+from PyInstaller.utils.hooks import collect_all
+
+project_root = Path(SPECPATH)
+src_dir = project_root / "src"
+
+# Add all Python packages from src
+datas = [
+    (str(src_dir / package), package)
+    for package in ("utils", "models", "services", "storage", "gui")
+]
+binaries = []
+
+# Hidden imports for CustomTkinter and standard libraries
+hiddenimports = ["customtkinter", "tkinter", "logging", "logging.handlers", "sqlite3"]
+for package in (customtkinter, tkinter):
+    prefix = f"{package.__name__}."
+    hiddenimports.extend(module.name for module in pkgutil.walk_packages(package.__path__, prefix))
+
+# Collect all CustomTkinter resources
+ctk_datas, ctk_binaries, ctk_hiddenimports = collect_all("customtkinter")
+datas += ctk_datas
+binaries += ctk_binaries
+hiddenimports += ctk_hiddenimports
+
+# Add icon if it exists
+icon_path = project_root / "assets" / "icons" / "app.ico"
+icon = [str(icon_path)] if icon_path.exists() else None
+
+# UPX compression is only applied to Windows x64 builds with the bundled
+# tools/upx, matching scripts/build.py; these DLLs are known to break or
+# trip antivirus when compressed
+use_upx = (
+    sys.platform == "win32"
+    and platform.machine() == "AMD64"
+    and (project_root / "tools" / "upx").exists()
+)
+upx_exclude = ["vcruntime140.dll", "python3*.dll", "ucrtbase.dll"]
+
+a = Analysis(
+    [str(src_dir / "main.py")],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="ClaudeConfigSwitcher",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=use_upx,
+    upx_exclude=upx_exclude,
+    console=False,  # No console window for GUI app
+    icon=icon,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=use_upx,
+    upx_exclude=upx_exclude,
+    name="ClaudeConfigSwitcher",
+)
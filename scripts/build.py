@@ -5,9 +5,15 @@ PyInstaller build script for creating standalone executable.
 import os
 import sys
 import shutil
+import platform
 import subprocess
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Directories not searched for __pycache__ when cleaning
+PYCACHE_SKIP_DIRS = {".git", "dist", "build", "node_modules", ".venv", "portable"}
+
 # Fix encoding for Windows console
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -16,67 +22,46 @@ if sys.platform == "win32":
 def run_command(cmd, cwd=None):
     """Run a command and return the result."""
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    # Output streams straight to the terminal instead of being buffered
+    result = subprocess.run(cmd, cwd=cwd, check=False)
     if result.returncode != 0:
-        print(f"Error: {result.stderr}")
+        print(f"Error: command exited with code {result.returncode}")
         sys.exit(result.returncode)
     return result
 
-def build_executable():
-    """Build standalone executable using PyInstaller."""
+def build_executable(full=False):
+    """Build standalone executable using PyInstaller.
+
+    The build/ work directory is kept between runs so PyInstaller can reuse
+    its analysis cache; pass full=True to wipe it first.
+    """
     print("Building Claude Code Configuration Switcher executable...")
 
-    # Get project root
-    project_root = Path(__file__).parent.parent
-    print(f"Project root: {project_root}")
+    print(f"Project root: {PROJECT_ROOT}")
 
     # Ensure we're in project root
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
 
     # Clean previous builds
     print("Cleaning previous builds...")
-    dist_dir = project_root / "dist"
-    build_dir = project_root / "build"
+    dist_dir = PROJECT_ROOT / "dist"
+    build_dir = PROJECT_ROOT / "build"
 
     if dist_dir.exists():
         shutil.rmtree(dist_dir)
-    if build_dir.exists():
+    if full and build_dir.exists():
         shutil.rmtree(build_dir)
 
-    # PyInstaller command (Windows uses semicolon for --add-data)
-    separator = ";" if sys.platform == "win32" else ":"
-
-    cmd = [
-        "uv", "run", "pyinstaller",
-        "--name=ClaudeConfigSwitcher",
-        "--onefile",
-        "--windowed",  # No console window for GUI app
-        # Add all Python packages from src
-        f"--add-data=src/utils{separator}utils",
-        f"--add-data=src/models{separator}models",
-        f"--add-data=src/services{separator}services",
-        f"--add-data=src/storage{separator}storage",
-        f"--add-data=src/gui{separator}gui",
-        # Hidden imports for CustomTkinter and standard libraries
-        "--hidden-import=customtkinter",
-        "--hidden-import=tkinter",
-        "--hidden-import=tkinter.scrolledtext",
-        "--hidden-import=tkinter.simpledialog",
-        "--hidden-import=tkinter.messagebox",
-        "--hidden-import=tkinter.filedialog",
-        "--hidden-import=logging",
-        "--hidden-import=logging.handlers",
-        "--hidden-import=sqlite3",
-        # Collect all CustomTkinter resources
-        "--collect-all=customtkinter",
-        # Main entry point
-        "src/main.py"
-    ]
-
-    # Add icon if it exists
-    icon_path = project_root / "assets" / "icons" / "app.ico"
-    if icon_path.exists():
-        cmd.insert(-1, f"--icon={icon_path}")
+    # PyInstaller reads its analysis options from the committed spec file
+    cmd = ["uv", "run", "pyinstaller", "--noconfirm"]
+
+    # Compress with UPX if it is available (Windows x64 builds only; the
+    # bundled UPX is x64, so ARM64 is excluded). Keep in sync with the spec.
+    upx_dir = PROJECT_ROOT / "tools" / "upx"
+    if sys.platform == "win32" and platform.machine() == "AMD64" and upx_dir.exists():
+        cmd.append(f"--upx-dir={upx_dir}")
+
+    cmd.append("ClaudeConfigSwitcher.spec")
 
     print(f"Build command: {' '.join(cmd)}")
     result = run_command(cmd)
@@ -85,7 +70,7 @@ def build_executable():
         print("✓ Build completed successfully!")
 
         # Show output file info
-        exe_file = dist_dir / "ClaudeConfigSwitcher.exe"
+        exe_file = dist_dir / "ClaudeConfigSwitcher" / "ClaudeConfigSwitcher.exe"
         if exe_file.exists():
             size_mb = exe_file.stat().st_size / (1024 * 1024)
             print(f"✓ Executable created: {exe_file}")
@@ -96,13 +81,26 @@ def build_executable():
         print("✗ Build failed")
         sys.exit(1)
 
+def directory_size(path):
+    """Return the total size in bytes of all files under path."""
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
 def create_portable_package():
     """Create a portable package with executable and dependencies."""
-    project_root = Path(__file__).parent.parent
-    dist_dir = project_root / "dist"
-    portable_dir = project_root / "portable"
+    dist_dir = PROJECT_ROOT / "dist"
+    portable_dir = PROJECT_ROOT / "portable"
 
-    exe_file = dist_dir / "ClaudeConfigSwitcher.exe"
+    app_dir = dist_dir / "ClaudeConfigSwitcher"
+    exe_file = app_dir / "ClaudeConfigSwitcher.exe"
     if not exe_file.exists():
         print("⚠️ Executable not found. Run build first.")
         return
@@ -115,8 +113,8 @@ def create_portable_package():
 
     portable_dir.mkdir(parents=True)
 
-    # Copy executable
-    shutil.copy2(exe_file, portable_dir / "ClaudeConfigSwitcher.exe")
+    # Zip the onedir bundle (avoids the per-launch extraction of --onefile)
+    shutil.make_archive(str(portable_dir / "ClaudeConfigSwitcher"), "zip", app_dir)
 
     # Create README for portable package
     readme_content = """# Claude Code Configuration Switcher - Portable Version
@@ -125,7 +123,7 @@ def create_portable_package():
 A desktop GUI application for managing and switching between different Claude Code configuration profiles.
 
 ## Usage
-1. Double-click `ClaudeConfigSwitcher.exe` to launch the application
+1. Extract `ClaudeConfigSwitcher.zip` and double-click `ClaudeConfigSwitcher.exe` to launch the application
 2. The application will automatically detect your Claude Code configuration
 3. Create, edit, and manage configuration profiles
 4. Double-click profiles to apply them to Claude Code
@@ -144,11 +142,10 @@ A desktop GUI application for managing and switching between different Claude Co
 For issues and support, please visit the project repository.
 """
 
-    with open(portable_dir / "README.md", "w", encoding="utf-8") as f:
-        f.write(readme_content)
+    (portable_dir / "README.md").write_text(readme_content, encoding="utf-8")
 
     print(f"✓ Portable package created: {portable_dir}")
-    print(f"✓ Package size: {sum(f.stat().st_size for f in portable_dir.rglob('*') if f.is_file()) / (1024*1024):.1f} MB")
+    print(f"✓ Package size: {directory_size(portable_dir) / (1024*1024):.1f} MB")
 
 def main():
     """Main build function."""
@@ -157,30 +154,32 @@ def main():
     parser = argparse.ArgumentParser(description="Build Claude Code Configuration Switcher")
     parser.add_argument("--portable", action="store_true", help="Create portable package")
     parser.add_argument("--clean", action="store_true", help="Clean build artifacts only")
+    parser.add_argument("--full", action="store_true", help="Discard the PyInstaller build cache before building")
 
     args = parser.parse_args()
 
     if args.clean:
         # Clean build artifacts
-        project_root = Path(__file__).parent.parent
         print("Cleaning build artifacts...")
 
         for dir_name in ["dist", "build", "__pycache__"]:
-            dir_path = project_root / dir_name
+            dir_path = PROJECT_ROOT / dir_name
             if dir_path.exists():
                 shutil.rmtree(dir_path)
                 print(f"✓ Removed {dir_name}")
 
-        # Clean Python cache files
-        for pycache in project_root.rglob("__pycache__"):
-            if pycache.is_dir():
-                shutil.rmtree(pycache)
+        # Clean Python cache files, skipping trees that never hold our sources
+        for root, dirnames, _ in os.walk(PROJECT_ROOT, topdown=True):
+            dirnames[:] = [d for d in dirnames if d not in PYCACHE_SKIP_DIRS]
+            if "__pycache__" in dirnames:
+                shutil.rmtree(os.path.join(root, "__pycache__"))
+                dirnames.remove("__pycache__")
 
         print("✓ Clean completed")
         return
 
     # Build executable
-    build_executable()
+    build_executable(full=args.full)
 
     # Create portable package if requested
     if args.portable:
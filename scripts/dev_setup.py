@@ -5,18 +5,35 @@ Development environment setup script.
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 def run_command(cmd, cwd=None):
     """Run a command and return the result."""
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    # Output streams straight to the terminal instead of being buffered
+    result = subprocess.run(cmd, cwd=cwd, check=False)
     if result.returncode != 0:
-        print(f"Error: {result.stderr}")
+        print(f"Error: command exited with code {result.returncode}")
         return False
-    print(result.stdout)
     return True
 
+def _probe(cmd):
+    """Run a version probe, returning None if the tool is not installed."""
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+
+def write_executable(path, content):
+    """Atomically write an executable script (temp file + rename)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.chmod(tmp_path, 0o755)
+    os.replace(tmp_path, path)
+
 def check_prerequisites():
     """Check if prerequisites are installed."""
     print("Checking prerequisites...")
@@ -32,27 +49,29 @@ def check_prerequisites():
     else:
         print(f"[OK] Python {python_version.major}.{python_version.minor}.{python_version.micro}")
 
+    # Probe uv and git concurrently; they are independent process spawns
+    probes = [("uv", ["uv", "--version"]), ("git", ["git", "--version"])]
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(_probe, cmd) for name, cmd in probes}
+    results = {name: future.result() for name, future in futures.items()}
+
     # Check uv
-    try:
-        result = subprocess.run(["uv", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"[OK] uv {result.stdout.strip()}")
-        else:
-            print("[ERROR] uv not found")
-            return False
-    except FileNotFoundError:
+    result = results["uv"]
+    if result is None:
         print("[ERROR] uv not found. Please install uv first.")
         print("   Visit: https://github.com/astral-sh/uv")
         return False
+    if result.returncode == 0:
+        print(f"[OK] uv {result.stdout.strip()}")
+    else:
+        print("[ERROR] uv not found")
+        return False
 
     # Check git
-    try:
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"[OK] {result.stdout.strip()}")
-        else:
-            print("[WARN] git not found - version control features will be limited")
-    except FileNotFoundError:
+    result = results["git"]
+    if result is not None and result.returncode == 0:
+        print(f"[OK] {result.stdout.strip()}")
+    else:
         print("[WARN] git not found - version control features will be limited")
 
     return True
@@ -61,20 +80,12 @@ def setup_environment():
     """Set up the development environment."""
     print("\nSetting up development environment...")
 
-    # Get project root
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
 
-    # Install dependencies
+    # Install runtime and development dependencies in a single resolve
     print("Installing dependencies...")
-    if not run_command(["uv", "sync"]):
-        print("✗ Failed to install dependencies")
-        return False
-
-    # Install development dependencies
-    print("Installing development dependencies...")
     if not run_command(["uv", "sync", "--dev"]):
-        print("✗ Failed to install development dependencies")
+        print("✗ Failed to install dependencies")
         return False
 
     print("✓ Dependencies installed successfully")
@@ -84,7 +95,6 @@ def create_directories():
     """Create necessary directories."""
     print("\nCreating directories...")
 
-    project_root = Path(__file__).parent.parent
     directories = [
         "data",
         "logs",
@@ -94,7 +104,7 @@ def create_directories():
     ]
 
     for directory in directories:
-        dir_path = project_root / directory
+        dir_path = PROJECT_ROOT / directory
         dir_path.mkdir(parents=True, exist_ok=True)
         print(f"✓ Created {directory}")
 
@@ -102,8 +112,7 @@ def setup_git_hooks():
     """Set up git hooks for development."""
     print("\nSetting up git hooks...")
 
-    project_root = Path(__file__).parent.parent
-    hooks_dir = project_root / ".git" / "hooks"
+    hooks_dir = PROJECT_ROOT / ".git" / "hooks"
 
     if not hooks_dir.exists():
         print("⚠️ Not a git repository - skipping git hooks")
@@ -127,11 +136,7 @@ echo "✓ All checks passed"
 """
 
     hook_file = hooks_dir / "pre-commit"
-    with open(hook_file, "w") as f:
-        f.write(pre_commit_hook)
-
-    # Make hook executable
-    os.chmod(hook_file, 0o755)
+    write_executable(hook_file, pre_commit_hook)
 
     print("✓ Pre-commit hook installed")
 
@@ -139,10 +144,15 @@ def run_tests():
     """Run the test suite to verify setup."""
     print("\nRunning tests to verify setup...")
 
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
+
+    # Stop at the first failure (previously failed tests run first); output
+    # streams straight to the terminal
+    cmd = ["uv", "run", "pytest", "tests/", "-x", "--ff"]
+    print(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, check=False)
 
-    if not run_command(["uv", "run", "pytest", "tests/", "-v"]):
+    if result.returncode != 0:
         print("✗ Tests failed - setup may be incomplete")
         return False
 
@@ -153,30 +163,24 @@ def create_dev_scripts():
     """Create development convenience scripts."""
     print("\nCreating development scripts...")
 
-    project_root = Path(__file__).parent.parent
-
     # Run script
     run_script = f"""#!/bin/bash
 # Development run script
-cd "{project_root}"
+cd "{PROJECT_ROOT}"
 uv run python src/main.py "$@"
 """
-    run_script_file = project_root / "run.sh"
-    with open(run_script_file, "w") as f:
-        f.write(run_script)
-    os.chmod(run_script_file, 0o755)
+    run_script_file = PROJECT_ROOT / "run.sh"
+    write_executable(run_script_file, run_script)
     print("✓ Created run.sh")
 
     # Test script
     test_script = f"""#!/bin/bash
 # Test runner script
-cd "{project_root}"
+cd "{PROJECT_ROOT}"
 uv run pytest tests/ -v "$@"
 """
-    test_script_file = project_root / "test.sh"
-    with open(test_script_file, "w") as f:
-        f.write(test_script)
-    os.chmod(test_script_file, 0o755)
+    test_script_file = PROJECT_ROOT / "test.sh"
+    write_executable(test_script_file, test_script)
     print("✓ Created test.sh")
 
 def show_next_steps():
@@ -205,6 +209,13 @@ def show_next_steps():
 
 def main():
     """Main setup function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Set up the development environment")
+    parser.add_argument("--run-tests", action="store_true", help="Run the test suite after setup")
+
+    args = parser.parse_args()
+
     print("Claude Code Configuration Switcher - Development Setup")
     print("="*60)
 
@@ -226,7 +237,10 @@ def main():
     create_dev_scripts()
 
     # Run tests to verify setup
-    if not run_tests():
+    if not args.run_tests:
+        show_next_steps()
+        print("\nRun `./test.sh` to verify setup")
+    elif not run_tests():
         print("\n⚠️ Setup completed but tests failed")
         print("   Check the test output above for issues")
     else:
@@ -3,6 +3,8 @@ CLI entry point for the Claude Code Configuration Switcher.
 """
 
 import argparse
+import csv
+import datetime
 import sys
 import json
 import os
@@ -19,11 +21,8 @@ else:
 # Add bundle dir to path for imports
 sys.path.insert(0, str(bundle_dir))
 
-from utils.logger import setup_logging
-from utils.paths import detect_claude_config_path
-from models.config import AppConfig, get_default_config_path
-from services.profile_service import ProfileService
-from services.config_service import ConfigService
+# Row template for `profile list --format table`, parsed once
+_ROW_FMT = "{:<5} {:<20} {:<30} {:<8} {:<20}".format
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
@@ -44,12 +43,6 @@ def create_parser() -> argparse.ArgumentParser:
         default="INFO",
         help="Set logging level"
     )
-    parser.add_argument(
-        "--format",
-        choices=["text", "json", "yaml"],
-        default="text",
-        help="Output format"
-    )
     parser.add_argument(
         "--no-color",
         action="store_true",
@@ -199,7 +192,7 @@ def create_parser() -> argparse.ArgumentParser:
     config_subparsers = config_parser.add_subparsers(dest="config_command")
 
     # config status
-    config_parser.add_argument("status", help="Show configuration status")
+    config_subparsers.add_parser("status", help="Show configuration status")
 
     # config backup
     backup_parser = config_subparsers.add_parser("backup", help="Backup management")
@@ -226,6 +219,17 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
 
+    if args.command not in ("profile", "config"):
+        parser.print_help()
+        sys.exit(2)
+
+    # Imported here so --help, --version and bare invocations skip loading
+    # the services, SQLite and logging handlers
+    from utils.logger import setup_logging
+    from utils.paths import detect_claude_config_path
+    from services.profile_service import ProfileService
+    from services.config_service import ConfigService
+
     # Setup logging
     logger = setup_logging(level=args.log_level, console_output=True)
     logger.debug(f"CLI arguments: {vars(args)}")
@@ -251,9 +255,6 @@ def main():
             handle_profile_command(args, profile_service, config_service, claude_config_path)
         elif args.command == "config":
             handle_config_command(args, profile_service, config_service, claude_config_path)
-        else:
-            parser.print_help()
-            sys.exit(2)
 
     except Exception as e:
         logger.error(f"CLI error: {e}")
@@ -265,19 +266,26 @@ def handle_profile_command(args, profile_service, config_service, claude_config_
     if args.profile_command == "list":
         profiles = profile_service.get_all_profiles()
         if args.active_only:
-            profiles = [p for p in profiles if p.get('is_active')]
+            profiles = [p for p in profiles if p.is_active]
 
         if args.format == "table":
-            print(f"{'ID':<5} {'Name':<20} {'Base URL':<30} {'Active':<8} {'Updated':<20}")
+            print(_ROW_FMT('ID', 'Name', 'Base URL', 'Active', 'Updated'))
             print("-" * 85)
             for profile in profiles:
-                config = json.loads(profile['config_json'])
-                base_url = config.get('env', {}).get('ANTHROPIC_BASE_URL', 'N/A')
-                active = "✓" if profile['is_active'] else "✗"
-                updated = profile['updated_at'][:19] if profile['updated_at'] else 'N/A'
-                print(f"{profile['id']:<5} {profile['name']:<20} {base_url[:30]:<30} {active:<8} {updated:<20}")
+                base_url = profile.get_base_url() or 'N/A'
+                active = "✓" if profile.is_active else "✗"
+                updated = profile.updated_at.isoformat(sep=' ')[:19] if profile.updated_at else 'N/A'
+                print(_ROW_FMT(profile.id, profile.name, base_url[:30], active, updated))
+        elif args.format == "csv":
+            writer = csv.writer(sys.stdout)
+            writer.writerow(['id', 'name', 'base_url', 'is_active', 'updated_at'])
+            writer.writerows(
+                (p.id, p.name, p.get_base_url(), p.is_active,
+                 p.updated_at.isoformat() if p.updated_at else '')
+                for p in profiles
+            )
         else:
-            output = {"profiles": profiles, "total": len(profiles)}
+            output = {"profiles": [p.to_dict() for p in profiles], "total": len(profiles)}
             print(json.dumps(output, indent=2))
 
     elif args.profile_command == "show":
@@ -344,7 +352,6 @@ def handle_config_command(args, profile_service, config_service, claude_config_p
 
         # Get config modification time
         if claude_config_path.exists():
-            import datetime
             mtime = datetime.datetime.fromtimestamp(claude_config_path.stat().st_mtime)
             print(f"Config Modified: {mtime}")
 
@@ -360,12 +367,15 @@ def handle_config_command(args, profile_service, config_service, claude_config_p
         if args.list:
             backup_dir = claude_config_path.parent / "backups"
             if backup_dir.exists():
-                backups = sorted(backup_dir.glob("settings.json.backup.*"), reverse=True)
+                # DirEntry caches its stat result, so each backup is stat'ed once
+                with os.scandir(backup_dir) as it:
+                    backups = [e for e in it if e.name.startswith("settings.json.backup.")]
+                backups.sort(key=lambda e: e.stat().st_mtime, reverse=True)
                 print("Available Backups:")
                 for i, backup in enumerate(backups, 1):
-                    mtime = datetime.datetime.fromtimestamp(backup.stat().st_mtime)
-                    size = backup.stat().st_size
-                    print(f"{i}. {backup.name} ({mtime}) - {size} bytes")
+                    stat = backup.stat()
+                    mtime = datetime.datetime.fromtimestamp(stat.st_mtime)
+                    print(f"{i}. {backup.name} ({mtime}) - {stat.st_size} bytes")
             else:
                 print("No backups found")
         else:
@@ -2,8 +2,11 @@
 Main application window for the Claude Code Configuration Switcher.
 """
 
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
+from concurrent.futures import Future, ThreadPoolExecutor
 import customtkinter as ctk
 from pathlib import Path
 from typing import Optional
@@ -15,14 +18,37 @@ from utils.logger import get_logger
 from utils.exceptions import ConfigSwitcherError
 from utils.environment import setup_environment
 from gui.widgets.profile_list import ProfileListWidget
-from gui.widgets.settings_dialog import SettingsDialog
-from gui.widgets.profile_editor import ProfileEditorDialog
 
 logger = get_logger(__name__)
 
 class Application(ctk.CTk):
     """Main application window."""
 
+    # Action bar buttons: (text, handler, state once setup completes, attribute)
+    _BUTTON_SPECS = (
+        ("Create Profile (Ctrl+N)", "_create_profile", "normal", "create_button"),
+        ("Edit Profile (Ctrl+E)", "_edit_profile", "disabled", "edit_button"),
+        ("Delete Profile (Del)", "_delete_profile", "disabled", "delete_button"),
+        ("Duplicate (Ctrl+D)", "_duplicate_profile", "disabled", "duplicate_button"),
+        ("Refresh (F5)", "_refresh_profiles", "normal", "refresh_button"),
+        ("⚙️ Settings", "_show_settings_dialog", "normal", "settings_button"),
+    )
+
+    # Keyboard shortcuts: (event sequence, handler)
+    _SHORTCUTS = (
+        ('<Control-n>', '_create_profile'),
+        ('<Control-e>', '_edit_profile'),
+        ('<Delete>', '_delete_profile'),
+        ('<Control-d>', '_duplicate_profile'),
+        ('<F5>', '_refresh_profiles'),
+        ('<Control-r>', '_refresh_profiles'),
+        ('<Control-comma>', '_show_settings_dialog'),
+        ('<Control-q>', '_on_closing'),
+    )
+
+    # Seconds to wait for setup_environment() before reporting failure
+    _SETUP_TIMEOUT = 10
+
     def __init__(
         self,
         claude_config_path: Path,
@@ -42,11 +68,36 @@ class Application(ctk.CTk):
         self.claude_config_path = claude_config_path
         self.app_config = app_config
         self.app_config_path = app_config_path
+        self._app_config_mtime = self._get_app_config_mtime()
 
         # Initialize services
         self.profile_service = ProfileService()
         self.config_service = ConfigService(claude_config_path)
 
+        # Profiles are read from the database off the Tk thread
+        self._loader_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_load: Optional[Future] = None
+        self._status_after_id: Optional[str] = None
+
+        # Status text is recomputed only after profile data changes
+        self._status_text: Optional[str] = None
+        self._status_dirty = True
+
+        # Window size as last reported by <Configure>, and as last written to disk
+        self._last_size = (app_config.window_width, app_config.window_height)
+        self._saved_size = self._last_size
+        self._size_after_id: Optional[str] = None
+
+        # Actions stay disabled until run() finishes environment setup
+        self._setup_executor: Optional[ThreadPoolExecutor] = None
+        self._setup_done = False
+
+        # Handlers resolved to bound methods once, shared by buttons and shortcuts
+        self._handlers = {
+            handler: getattr(self, handler)
+            for handler in {spec[1] for spec in self._BUTTON_SPECS} | {spec[1] for spec in self._SHORTCUTS}
+        }
+
         # Setup window
         self._setup_window()
         self._create_widgets()
@@ -66,45 +117,18 @@ class Application(ctk.CTk):
         self.minsize(800, 400)
 
         # Set theme
-        theme = self.app_config.theme.lower()
-        if theme == "dark":
-            ctk.set_appearance_mode("Dark")
-        elif theme == "light":
-            ctk.set_appearance_mode("Light")
-        else:  # system
-            ctk.set_appearance_mode("System")
+        self._applied_theme: Optional[str] = None
+        self._apply_theme()
 
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
-
-        # Setup keyboard shortcuts
-        self._setup_keyboard_shortcuts()
+        self.bind("<Configure>", self._on_configure)
 
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for common actions."""
-        # Ctrl+N: New/Create Profile
-        self.bind('<Control-n>', lambda e: self._create_profile())
-
-        # Ctrl+E: Edit Profile
-        self.bind('<Control-e>', lambda e: self._edit_profile())
-
-        # Delete: Delete Profile
-        self.bind('<Delete>', lambda e: self._delete_profile())
-
-        # Ctrl+D: Duplicate Profile
-        self.bind('<Control-d>', lambda e: self._duplicate_profile())
-
-        # F5 or Ctrl+R: Refresh
-        self.bind('<F5>', lambda e: self._refresh_profiles())
-        self.bind('<Control-r>', lambda e: self._refresh_profiles())
-
-        # Ctrl+,: Settings (common shortcut for settings)
-        self.bind('<Control-comma>', lambda e: self._show_settings_dialog())
-
-        # Ctrl+Q: Quit
-        self.bind('<Control-q>', lambda e: self._on_closing())
-
         # Alt+F4 is handled by OS
+        for sequence, handler in self._SHORTCUTS:
+            self.bind(sequence, lambda e, method=self._handlers[handler]: method())
 
         logger.debug("Keyboard shortcuts initialized")
 
@@ -119,63 +143,48 @@ class Application(ctk.CTk):
             self.profile_service,
             self.config_service,
             on_profile_selected=self._on_profile_selected,
-            on_profile_activated=self._on_profile_activated
+            on_profile_activated=self._on_profile_activated,
+            on_profile_deselected=self._on_profile_deselected
         )
 
+        # Non-blocking toast for success messages, hidden until shown
+        self._toast = ctk.CTkLabel(self, text="", fg_color=("gray80", "gray20"), corner_radius=6)
+        self._toast_after_id: Optional[str] = None
+
+        # Indeterminate progress bar shown while profiles load
+        self.loading_bar = ctk.CTkProgressBar(self.content_frame, mode="indeterminate")
+
         # Bottom frame for action buttons
         self.action_frame = ctk.CTkFrame(self)
 
-        # Create profile button
-        self.create_button = ctk.CTkButton(
-            self.action_frame,
-            text="Create Profile (Ctrl+N)",
-            command=self._create_profile
-        )
-        self.create_button.grid(row=0, column=0, padx=1, pady=1)
-
-        # Edit profile button
-        self.edit_button = ctk.CTkButton(
-            self.action_frame,
-            text="Edit Profile (Ctrl+E)",
-            command=self._edit_profile,
-            state="disabled"
-        )
-        self.edit_button.grid(row=0, column=1, padx=1, pady=1)
-
-        # Delete profile button
-        self.delete_button = ctk.CTkButton(
-            self.action_frame,
-            text="Delete Profile (Del)",
-            command=self._delete_profile,
-            state="disabled"
-        )
-        self.delete_button.grid(row=0, column=2, padx=1, pady=1)
-
-        # Duplicate profile button
-        self.duplicate_button = ctk.CTkButton(
-            self.action_frame,
-            text="Duplicate (Ctrl+D)",
-            command=self._duplicate_profile,
-            state="disabled"
-        )
-        self.duplicate_button.grid(row=0, column=3, padx=1, pady=1)
+        # Native ttk buttons skip CustomTkinter's per-widget canvas drawing;
+        # only the settings button stays a CTkButton for emoji rendering
+        # All buttons start disabled; _on_setup_complete() enables them
+        ttk.Style(self).configure("Action.TButton", padding=4)
+        for column, (text, handler, _, attr) in enumerate(self._BUTTON_SPECS):
+            if attr == "settings_button":
+                button = ctk.CTkButton(
+                    self.action_frame,
+                    text=text,
+                    width=80,
+                    command=self._handlers[handler],
+                    state="disabled"
+                )
+            else:
+                button = ttk.Button(
+                    self.action_frame,
+                    text=text,
+                    command=self._handlers[handler],
+                    state="disabled",
+                    style="Action.TButton"
+                )
+            # Only the Create button stretches
+            button.pack(side="left", padx=1, pady=1, fill="x", expand=column == 0)
+            setattr(self, attr, button)
 
-        # Refresh button
-        self.refresh_button = ctk.CTkButton(
-            self.action_frame,
-            text="Refresh (F5)",
-            command=self._refresh_profiles
-        )
-        self.refresh_button.grid(row=0, column=4, padx=1, pady=1)
-
-        # Settings button
-        self.settings_button = ctk.CTkButton(
-            self.action_frame,
-            text="⚙️ Settings",
-            width=80,
-            command=self._show_settings_dialog
-        )
-        self.settings_button.grid(row=0, column=5, padx=1, pady=1)
+        # Buttons that need a selected profile
+        self._action_buttons = (self.edit_button, self.delete_button, self.duplicate_button)
+        self._last_action_state = "disabled"
 
     def _setup_layout(self):
         """Setup widget layout."""
@@ -193,17 +202,31 @@ class Application(ctk.CTk):
 
         # Action frame - 底部按钮
         self.action_frame.grid(row=1, column=0, sticky="ew", padx=0, pady=0)
-        self.action_frame.grid_columnconfigure(0, weight=1)  # Create button
-        self.action_frame.grid_columnconfigure(1, weight=0)  # Edit button
-        self.action_frame.grid_columnconfigure(2, weight=0)  # Delete button
-        self.action_frame.grid_columnconfigure(3, weight=0)  # Duplicate button
-        self.action_frame.grid_columnconfigure(4, weight=0)  # Refresh button
-        self.action_frame.grid_columnconfigure(5, weight=0)  # Settings button
 
     def _load_profiles(self):
-        """Load and display profiles."""
+        """Load profiles in a worker thread and display them when ready."""
+        self.loading_bar.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
+        self.loading_bar.start()
+
+        self._pending_load = self._loader_executor.submit(self.profile_list.fetch_profiles)
+        self.after(20, self._poll_profiles, self._pending_load)
+
+    def _poll_profiles(self, future: Future):
+        """Render fetched profiles once the worker finishes (runs on the Tk thread)."""
+        if future is not self._pending_load:
+            return  # Superseded by a newer load
+
+        if not future.done():
+            self.after(20, self._poll_profiles, future)
+            return
+
+        self._pending_load = None
+        self.loading_bar.stop()
+        self.loading_bar.grid_remove()
+
         try:
-            self.profile_list.load_profiles()
+            self.profile_list.render_profiles(*future.result())
+            self._status_dirty = True
             self._update_status()
         except Exception as e:
             logger.error(f"Failed to load profiles: {e}")
@@ -212,19 +235,34 @@ class Application(ctk.CTk):
     def _on_profile_selected(self, profile):
         """Handle profile selection event."""
         # Enable action buttons when profile is selected
-        self.edit_button.configure(state="normal")
-        self.delete_button.configure(state="normal")
-        self.duplicate_button.configure(state="normal")
+        if self._setup_done:
+            self._set_action_state("normal")
+
+    def _on_profile_deselected(self):
+        """Handle selection being cleared."""
+        self._set_action_state("disabled")
+
+    def _set_action_state(self, state: str):
+        """Set the state of selection-dependent buttons, skipping no-op updates."""
+        if state == self._last_action_state:
+            return
+        for button in self._action_buttons:
+            button.configure(state=state)
+        self._last_action_state = state
 
     def _on_profile_activated(self, profile):
         """Handle profile activation event."""
+        self._status_dirty = True
         self._update_status()
 
     def _create_profile(self):
         """Handle create profile button click."""
+        from gui.widgets.profile_editor import ProfileEditorDialog
+
         try:
+            self.update_idletasks()
             dialog = ProfileEditorDialog(self, title="Create New Profile")
-            dialog.wait_window()
+            self._wait_dialog(dialog)
 
             if dialog.result_profile:
                 try:
@@ -232,11 +270,9 @@ class Application(ctk.CTk):
                         dialog.result_profile.name,
                         dialog.result_profile.config_json
                     )
-                    self._load_profiles()
-                    messagebox.showinfo(
-                        "Success",
-                        f"Profile '{dialog.result_profile.name}' created successfully"
-                    )
+                    self.profile_list.add_row(self.profile_service.get_profile(profile_id))
+                    self._schedule_status_update()
+                    self._toast_show(f"Profile '{dialog.result_profile.name}' created successfully")
                     logger.info(f"Created new profile: {dialog.result_profile.name}")
 
                 except Exception as e:
@@ -253,9 +289,12 @@ class Application(ctk.CTk):
         if not selected_profile:
             return
 
+        from gui.widgets.profile_editor import ProfileEditorDialog
+
         try:
+            self.update_idletasks()
             dialog = ProfileEditorDialog(self, title="Edit Profile", profile=selected_profile)
-            dialog.wait_window()
+            self._wait_dialog(dialog)
 
             if dialog.result_profile:
                 try:
@@ -265,11 +304,12 @@ class Application(ctk.CTk):
                         config_json=dialog.result_profile.config_json
                     )
                     if success:
-                        self._load_profiles()
-                        messagebox.showinfo(
-                            "Success",
-                            f"Profile '{dialog.result_profile.name}' updated successfully"
+                        self.profile_list.update_row(
+                            selected_profile.id,
+                            self.profile_service.get_profile(selected_profile.id)
                         )
+                        self._schedule_status_update()
+                        self._toast_show(f"Profile '{dialog.result_profile.name}' updated successfully")
                         logger.info(f"Updated profile: {dialog.result_profile.name}")
                     else:
                         messagebox.showerror("Error", "Failed to update profile")
@@ -296,8 +336,9 @@ class Application(ctk.CTk):
             ):
                 try:
                     self.profile_service.delete_profile(selected_profile.id)
-                    self._load_profiles()
-                    messagebox.showinfo("Success", f"Profile '{selected_profile.name}' deleted successfully")
+                    self.profile_list.remove_row(selected_profile.id)
+                    self._schedule_status_update()
+                    self._toast_show(f"Profile '{selected_profile.name}' deleted successfully")
                 except Exception as e:
                     logger.error(f"Failed to delete profile: {e}")
                     messagebox.showerror("Error", f"Failed to delete profile: {e}")
@@ -308,45 +349,79 @@ class Application(ctk.CTk):
         if not selected_profile:
             return
 
-        # Simple input dialog for new name
-        from tkinter import simpledialog
-
-        new_name = simpledialog.askstring(
-            "Duplicate Profile",
-            f"Enter name for duplicate of '{selected_profile.name}':",
-            parent=self
+        self.profile_list.begin_rename(
+            selected_profile.id,
+            f"Copy of {selected_profile.name}",
+            lambda new_name: self._commit_duplicate(selected_profile, new_name)
         )
 
-        if not new_name or not new_name.strip():
-            return
+    def _commit_duplicate(self, source_profile, new_name: str):
+        """
+        Create the duplicate once an inline name has been entered.
 
+        Args:
+            source_profile: Profile being duplicated
+            new_name: Name for the duplicate
+        """
         try:
-            profile_id = self.profile_service.duplicate_profile(selected_profile.id, new_name.strip())
-            self._load_profiles()
-            messagebox.showinfo(
-                "Success",
-                f"Profile '{new_name}' created successfully"
-            )
-            logger.info(f"Duplicated profile '{selected_profile.name}' to '{new_name}'")
+            profile_id = self.profile_service.duplicate_profile(source_profile.id, new_name)
+            self.profile_list.add_row(self.profile_service.get_profile(profile_id))
+            self._schedule_status_update()
+            self._toast_show(f"Profile '{new_name}' created successfully")
+            logger.info(f"Duplicated profile '{source_profile.name}' to '{new_name}'")
 
         except Exception as e:
             logger.error(f"Failed to duplicate profile: {e}")
             messagebox.showerror("Error", f"Failed to duplicate profile: {e}")
 
+    def _toast_show(self, message: str, ms: int = 2000):
+        """
+        Show a transient message below the action bar.
+
+        Args:
+            message: Text to display
+            ms: How long to show the message, in milliseconds
+        """
+        if self._toast_after_id is not None:
+            self.after_cancel(self._toast_after_id)
+
+        self._toast.configure(text=message)
+        self._toast.grid(row=2, column=0, sticky="ew", padx=5, pady=(0, 5))
+        self._toast_after_id = self.after(ms, self._toast_hide)
+
+    def _toast_hide(self):
+        """Hide the toast message."""
+        self._toast_after_id = None
+        self._toast.grid_remove()
+
+    def _wait_dialog(self, dialog):
+        """
+        Block until a modal dialog closes.
+
+        Dialogs make themselves transient and grab input on creation; pending
+        geometry work is flushed once before and once after instead of
+        piecemeal as focus returns.
+        """
+        dialog.wait_window()
+        self.update_idletasks()
+
     def _refresh_profiles(self):
         """Handle refresh button click."""
         self._load_profiles()
 
     def _show_settings_dialog(self):
         """Show settings dialog."""
+        from gui.widgets.settings_dialog import SettingsDialog
+
         try:
+            self.update_idletasks()
             dialog = SettingsDialog(
                 self,
                 self.app_config,
                 self.claude_config_path,
                 self.app_config_path
             )
-            dialog.wait_window()
+            self._wait_dialog(dialog)
 
             # Reload if configuration changed
             if dialog.result:
@@ -356,15 +431,28 @@ class Application(ctk.CTk):
             logger.error(f"Failed to show settings dialog: {e}")
             messagebox.showerror("Error", f"Failed to show settings: {e}")
 
+    def _schedule_status_update(self):
+        """Coalesce status updates from rapid changes into one refresh."""
+        self._status_dirty = True
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self._status_after_id = self.after(100, self._update_status)
+
     def _update_status(self):
         """Update status information."""
+        self._status_after_id = None
+        if not self._status_dirty:
+            return
+
         try:
-            active_profile = self.profile_service.get_active_profile()
-            profile_count = self.profile_service.get_profile_count()
+            snapshot = self.profile_service.get_snapshot()
+
+            status_text = f"Profiles: {snapshot.profile_count}"
+            if snapshot.active_name:
+                status_text += f" | Active: {snapshot.active_name}"
 
-            status_text = f"Profiles: {profile_count}"
-            if active_profile:
-                status_text += f" | Active: {active_profile.name}"
+            self._status_text = status_text
+            self._status_dirty = False
 
             # TODO: Add status bar if needed
             logger.debug(f"Status updated: {status_text}")
@@ -375,20 +463,22 @@ class Application(ctk.CTk):
     def _reload_configuration(self):
         """Reload application configuration."""
         try:
-            # Reload app config
-            self.app_config = AppConfig.load_from_file(self.app_config_path)
-
-            # Update window geometry
-            self.geometry(f"{self.app_config.window_width}x{self.app_config.window_height}")
+            # Reload app config only if the file changed on disk
+            mtime = self._get_app_config_mtime()
+            if mtime is not None and mtime == self._app_config_mtime:
+                logger.debug("App config unchanged on disk, skipping reload")
+            else:
+                self.app_config = AppConfig.load_from_file(self.app_config_path)
+                self._app_config_mtime = mtime
+                self._saved_size = (self.app_config.window_width, self.app_config.window_height)
+
+            # Update window geometry; setting it fires a <Configure> cascade
+            size = (self.app_config.window_width, self.app_config.window_height)
+            if size != self._last_size:
+                self.geometry(f"{size[0]}x{size[1]}")
 
             # Update theme
-            theme = self.app_config.theme.lower()
-            if theme == "dark":
-                ctk.set_appearance_mode("Dark")
-            elif theme == "light":
-                ctk.set_appearance_mode("Light")
-            else:  # system
-                ctk.set_appearance_mode("System")
+            self._apply_theme()
 
             # Reload profiles
             self._load_profiles()
@@ -398,15 +488,52 @@ class Application(ctk.CTk):
         except Exception as e:
             logger.error(f"Failed to reload configuration: {e}")
 
+    def _apply_theme(self) -> bool:
+        """
+        Set the appearance mode from the app config if it changed.
+
+        set_appearance_mode() redraws every CustomTkinter widget, so it is
+        skipped when the configured theme is already applied.
+
+        Returns:
+            True if the appearance mode was set
+        """
+        theme = self.app_config.theme.lower()
+        if theme == self._applied_theme:
+            return False
+
+        if theme == "dark":
+            ctk.set_appearance_mode("Dark")
+        elif theme == "light":
+            ctk.set_appearance_mode("Light")
+        else:  # system
+            ctk.set_appearance_mode("System")
+
+        self._applied_theme = theme
+        return True
+
+    def _get_app_config_mtime(self) -> Optional[int]:
+        """Get the app config file modification time, or None if unavailable."""
+        try:
+            return self.app_config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _on_closing(self):
         """Handle window closing event."""
         try:
-            # Save window geometry
-            self.app_config.window_width = self.winfo_width()
-            self.app_config.window_height = self.winfo_height()
-            self.app_config.save_to_file(self.app_config_path)
+            # Save window geometry, skipping the write if the size is unchanged
+            if self._last_size != self._saved_size:
+                self.app_config.window_width, self.app_config.window_height = self._last_size
+                save_thread = threading.Thread(
+                    target=self.app_config.save_to_file,
+                    args=(self.app_config_path,)
+                )
+                save_thread.start()
+                save_thread.join(timeout=0.5)
 
-            # Close database connection
+            # Stop the profile loader and close database connection
+            self._loader_executor.shutdown(wait=False, cancel_futures=True)
             self.profile_service.database.close_connection()
 
             logger.info("Application closing")
@@ -416,20 +543,67 @@ class Application(ctk.CTk):
 
         self.destroy()
 
+    def _on_configure(self, event):
+        """Remember the window size; child <Configure> events are ignored."""
+        if event.widget is not self:
+            return
+        self._last_size = (event.width, event.height)
+        if self._size_after_id is None:
+            self._size_after_id = self.after_idle(self._store_window_size)
+
+    def _store_window_size(self):
+        """Copy the last seen window size into the app config once per resize burst."""
+        self._size_after_id = None
+        self.app_config.window_width, self.app_config.window_height = self._last_size
+
     def run(self):
         """Start the application main loop."""
-        try:
-            # Setup environment
-            if not setup_environment():
-                messagebox.showerror(
-                    "Setup Error",
-                    "Failed to setup application environment. Check logs for details."
-                )
-                return
+        # Set up the environment off the Tk thread while the window is shown
+        self._setup_executor = ThreadPoolExecutor(max_workers=1)
+        setup_future = self._setup_executor.submit(setup_environment)
+        self.after(20, self._poll_setup, setup_future, time.monotonic() + self._SETUP_TIMEOUT)
 
+        try:
             logger.info("Starting application main loop")
             self.mainloop()
 
         except Exception as e:
             logger.error(f"Application error: {e}")
-            messagebox.showerror("Application Error", f"An error occurred: {e}")
\ No newline at end of file
+            messagebox.showerror("Application Error", f"An error occurred: {e}")
+        finally:
+            self._setup_executor.shutdown(wait=False)
+
+    def _poll_setup(self, future: Future, deadline: float):
+        """Enable the UI once environment setup succeeds (runs on the Tk thread)."""
+        if not future.done():
+            if time.monotonic() < deadline:
+                self.after(20, self._poll_setup, future, deadline)
+                return
+            logger.error("Environment setup timed out")
+            ok = False
+        else:
+            try:
+                ok = future.result()
+            except Exception as e:
+                logger.error(f"Environment setup failed: {e}")
+                ok = False
+
+        if not ok:
+            messagebox.showerror(
+                "Setup Error",
+                "Failed to setup application environment. Check logs for details."
+            )
+            self._on_closing()
+            return
+
+        self._on_setup_complete()
+
+    def _on_setup_complete(self):
+        """Enable buttons and keyboard shortcuts after environment setup."""
+        self._setup_done = True
+        for _, _, state, attr in self._BUTTON_SPECS:
+            if state == "normal":
+                getattr(self, attr).configure(state="normal")
+        if self.profile_list.selected_profile is not None:
+            self._set_action_state("normal")
+        self._setup_keyboard_shortcuts()
@@ -1,10 +1,24 @@
 """
 GUI widgets for the configuration switcher application.
+
+Widgets are imported on first access (PEP 562) so that importing one
+widget module does not pull in every dialog.
 """
 
-from .profile_list import ProfileListWidget
-from .profile_editor import ProfileEditorDialog
-from .profile_preview import ProfilePreviewDialog
-from .settings_dialog import SettingsDialog
+from importlib import import_module
+
+_WIDGET_MODULES = {
+    "ProfileListWidget": ".profile_list",
+    "ProfileEditorDialog": ".profile_editor",
+    "ProfilePreviewDialog": ".profile_preview",
+    "SettingsDialog": ".settings_dialog",
+}
+
+__all__ = ["ProfileListWidget", "ProfileEditorDialog", "ProfilePreviewDialog", "SettingsDialog"]
 
-__all__ = ["ProfileListWidget", "ProfileEditorDialog", "ProfilePreviewDialog", "SettingsDialog"]
\ No newline at end of file
+def __getattr__(name):
+    """Lazily import widget classes on first access."""
+    module_name = _WIDGET_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
@@ -5,8 +5,9 @@ Profile editor dialog for creating and editing configuration profiles.
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import json
+import re
 
 from models.profile import Profile
 from utils.logger import get_logger
@@ -14,6 +15,100 @@ from utils.exceptions import ValidationError, InvalidJSONError
 
 logger = get_logger(__name__)
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, indent: int = 2, sort_keys: bool = False) -> str:
+        """Serialize with orjson; only 2-space indentation is supported."""
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+except ImportError:
+    # Built once; json.dumps() with indent constructs a new encoder per call.
+    # Non-ASCII is written as-is to match orjson
+    _DECODER = json.JSONDecoder()
+    _ENCODER_INDENT = json.JSONEncoder(ensure_ascii=False, indent=2)
+    _ENCODER_INDENT_SORTED = json.JSONEncoder(ensure_ascii=False, indent=2, sort_keys=True)
+
+    _loads = _DECODER.decode
+
+    def _dumps(obj: Any, indent: int = 2, sort_keys: bool = False) -> str:
+        """Serialize with a shared encoder; only 2-space indentation is supported."""
+        return (_ENCODER_INDENT_SORTED if sort_keys else _ENCODER_INDENT).encode(obj)
+
+# Auth token values longer than 10 characters, as masked by the editor
+_TOKEN_RE = re.compile(r'("ANTHROPIC_AUTH_TOKEN"\s*:\s*")([^"\\]{11,})(")')
+
+# Editor templates, serialized once at import
+_TEMPLATE_JSON = {
+    "Empty": "{}",
+    **{
+        name: _dumps(template, indent=2)
+        for name, template in {
+            "Development": {
+                "env": {
+                    "ANTHROPIC_BASE_URL": "https://api.dev.anthropic.com",
+                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-dev-token"
+                },
+                "model": "claude-3-haiku-20240307",
+                "max_tokens": 4096,
+                "temperature": 0.7
+            },
+            "Production": {
+                "env": {
+                    "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
+                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-prod-token"
+                },
+                "model": "claude-3-opus-20240229",
+                "max_tokens": 8192,
+                "temperature": 0.1
+            },
+            "Testing": {
+                "env": {
+                    "ANTHROPIC_BASE_URL": "https://api.test.anthropic.com",
+                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-test-token"
+                },
+                "model": "claude-3-sonnet-20240229",
+                "max_tokens": 2048,
+                "temperature": 0.5
+            }
+        }.items()
+    }
+}
+
+# "1\n2\n...\nN" built once; _LN_OFFSETS[k] is the index where number k ends
+_LN_CACHE = ""
+_LN_OFFSETS = [0]
+
+def _line_number_text(rendered: int, line_count: int) -> str:
+    """
+    Slice the gutter text for numbers rendered+1..line_count from the shared cache.
+
+    Args:
+        rendered: Highest number already shown (0 for an empty gutter)
+        line_count: Highest number to show
+
+    Returns:
+        The numbers joined by newlines, with a leading newline if rendered > 0
+    """
+    global _LN_CACHE
+    capacity = len(_LN_OFFSETS) - 1
+    if line_count > capacity:
+        # Grow to at least double so large pastes do not rebuild repeatedly
+        target = max(line_count, capacity * 2, 4096)
+        parts = [_LN_CACHE]
+        position = len(_LN_CACHE)
+        for number in range(capacity + 1, target + 1):
+            text = f"\n{number}" if number > 1 else "1"
+            parts.append(text)
+            position += len(text)
+            _LN_OFFSETS.append(position)
+        _LN_CACHE = "".join(parts)
+
+    return _LN_CACHE[_LN_OFFSETS[rendered]:_LN_OFFSETS[line_count]]
+
 class ProfileEditorDialog(ctk.CTkToplevel):
     """Dialog for creating and editing configuration profiles."""
 
@@ -37,6 +132,17 @@ class ProfileEditorDialog(ctk.CTkToplevel):
         self.result_profile = None
         self.is_edit_mode = profile is not None
 
+        # (stripped text, parsed object, decode error) of the last parse
+        self._parse_cache: Tuple[Optional[str], Any, Optional[json.JSONDecodeError]] = (None, None, None)
+
+        # Editor text as last read from Tk; re-read only after the widget reports a change
+        self._text_cache = ""
+        self._text_dirty = True
+
+        # Pending debounced line-number refresh and the line count currently shown
+        self._ln_after_id: Optional[str] = None
+        self._ln_last_lines = 0
+
         self._setup_dialog(title)
         self._create_widgets()
         self._load_profile_data()
@@ -129,10 +235,9 @@ class ProfileEditorDialog(ctk.CTkToplevel):
         )
         self.json_text.pack(side="left", fill="both", expand=True)
 
-        # Bind events
+        # Bind events; clicks and scrolling cannot change the line count
         self.json_text.bind("<KeyRelease>", self._on_text_change)
-        self.json_text.bind("<Button-1>", self._on_text_change)
-        self.json_text.bind("<MouseWheel>", self._on_text_change)
+        self.json_text.bind("<<Modified>>", self._mark_text_dirty)
 
         # Validation and helper frame
         validation_frame = ctk.CTkFrame(main_frame)
@@ -207,161 +312,143 @@ class ProfileEditorDialog(ctk.CTkToplevel):
         # Initial line numbers update
         self._update_line_numbers()
 
-    # Syntax highlighting removed - CustomTkinter CTkTextbox doesn't support tag_configure
-
     def _load_profile_data(self):
         """Load existing profile data into form."""
         if self.profile:
             self.name_var.set(self.profile.name)
-            self.json_text.insert("1.0", self.profile.config_json)
+            self._set_text(self.profile.config_json)
+            self._parse_cache = (None, None, None)
             self._update_line_numbers()
 
     def _load_template(self, template_name: str):
         """Load a configuration template."""
-        templates = {
-            "Empty": "{}",
-            "Development": {
-                "env": {
-                    "ANTHROPIC_BASE_URL": "https://api.dev.anthropic.com",
-                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-dev-token"
-                },
-                "model": "claude-3-haiku-20240307",
-                "max_tokens": 4096,
-                "temperature": 0.7
-            },
-            "Production": {
-                "env": {
-                    "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
-                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-prod-token"
-                },
-                "model": "claude-3-opus-20240229",
-                "max_tokens": 8192,
-                "temperature": 0.1
-            },
-            "Testing": {
-                "env": {
-                    "ANTHROPIC_BASE_URL": "https://api.test.anthropic.com",
-                    "ANTHROPIC_AUTH_TOKEN": "sk-ant-api03-test-token"
-                },
-                "model": "claude-3-sonnet-20240229",
-                "max_tokens": 2048,
-                "temperature": 0.5
-            }
-        }
-
-        if template_name in templates:
-            template_content = json.dumps(templates[template_name], indent=2)
-            self.json_text.delete("1.0", "end")
-            self.json_text.insert("1.0", template_content)
+        template_content = _TEMPLATE_JSON.get(template_name)
+        if template_content is not None:
+            self._set_text(template_content)
+            self._parse_cache = (None, None, None)
             self._update_line_numbers()
             self.status_label.configure(text=f"Loaded {template_name} template", text_color=("green", "green"))
 
+    def _get_text(self) -> str:
+        """Return the editor text, copying it out of Tk only if it changed."""
+        if self._text_dirty:
+            self._text_cache = self.json_text.get("1.0", "end-1c")
+            self._text_dirty = False
+            self.json_text.edit_modified(False)
+        return self._text_cache
+
+    def _set_text(self, content: str):
+        """Replace the editor text."""
+        self.json_text.delete("1.0", "end")
+        self.json_text.insert("1.0", content)
+        # <<Modified>> is delivered later through the event queue
+        self._text_dirty = True
+
+    def _mark_text_dirty(self, event=None):
+        """Invalidate the text cache; resetting the modified flag also fires this event."""
+        if self.json_text.edit_modified():
+            self._text_dirty = True
+
     def _on_text_change(self, event=None):
-        """Handle text change events."""
-        self._update_line_numbers()
+        """Handle text change events, coalescing bursts of keystrokes."""
+        if self._ln_after_id is not None:
+            self.after_cancel(self._ln_after_id)
+        self._ln_after_id = self.after(50, self._update_line_numbers)
 
     def _update_line_numbers(self):
         """Update line numbers display."""
-        # Get current text
-        content = self.json_text.get("1.0", "end-1c")
-        lines = content.split('\n')
+        self._ln_after_id = None
 
-        # Generate line numbers
-        line_numbers = '\n'.join(str(i + 1) for i in range(len(lines)))
+        # Count lines without splitting the text into a list
+        line_count = self._get_text().count('\n') + 1
+        rendered = self._ln_last_lines
+        if line_count == rendered:
+            return
 
-        # Update line numbers display
+        # Append or trim only the numbers that changed
         self.line_numbers.configure(state="normal")
-        self.line_numbers.delete("1.0", "end")
-        self.line_numbers.insert("1.0", line_numbers)
+        if line_count > rendered:
+            self.line_numbers.insert("end-1c", _line_number_text(rendered, line_count))
+        else:
+            self.line_numbers.delete(f"{line_count}.end", "end")
         self.line_numbers.configure(state="disabled")
+        self._ln_last_lines = line_count
 
-    # Syntax highlighting methods removed - CustomTkinter doesn't support text tagging
-
-    def _get_string_start(self, content, current_pos):
-        """Get the start position of the current string."""
-        # Find the last unmatched quote
-        string_start = current_pos - 1
-        while string_start >= 0:
-            if content[string_start] == '"':
-                # Check if it's escaped
-                escaped = False
-                escape_check = string_start - 1
-                while escape_check >= 0 and content[escape_check] == '\\':
-                    escaped = not escaped
-                    escape_check -= 1
-                if not escaped:
-                    break
-            string_start -= 1
-        return current_pos - string_start
+    def _get_parsed(self) -> Tuple[str, Any, Optional[json.JSONDecodeError]]:
+        """
+        Parse the editor content, reusing the last result if the text is unchanged.
+
+        Returns:
+            Tuple of (stripped text, parsed object or None, decode error or None)
+        """
+        content = self._get_text().strip()
+        if content == self._parse_cache[0]:
+            return self._parse_cache
+
+        try:
+            self._parse_cache = (content, _loads(content), None)
+        except json.JSONDecodeError as e:
+            self._parse_cache = (content, None, e)
+        return self._parse_cache
 
     def _validate_json(self):
         """Validate JSON syntax."""
-        content = self.json_text.get("1.0", "end-1c").strip()
+        content, _, error = self._get_parsed()
 
         if not content:
             self.status_label.configure(text="Please enter JSON configuration", text_color=("orange", "orange"))
             return False
 
-        try:
-            json.loads(content)
+        if error is None:
             self.status_label.configure(text="✓ Valid JSON", text_color=("green", "green"))
             return True
-        except json.JSONDecodeError as e:
-            self.status_label.configure(text=f"✗ JSON Error: {e.msg}", text_color=("red", "red"))
-            return False
+        self.status_label.configure(text=f"✗ JSON Error: {error.msg}", text_color=("red", "red"))
+        return False
 
     def _format_json(self):
         """Format JSON with proper indentation."""
-        content = self.json_text.get("1.0", "end-1c").strip()
+        content, parsed, error = self._get_parsed()
 
         if not content:
             return
 
-        try:
-            # Parse and reformat JSON
-            parsed = json.loads(content)
-            formatted = json.dumps(parsed, indent=2, sort_keys=True)
+        if error is not None:
+            self.status_label.configure(text=f"✗ Cannot format invalid JSON: {error.msg}", text_color=("red", "red"))
+            return
 
-            # Update text widget
-            self.json_text.delete("1.0", "end")
-            self.json_text.insert("1.0", formatted)
+        # Reformat JSON
+        formatted = _dumps(parsed, indent=2, sort_keys=True)
 
-            # Update line numbers
-            self._update_line_numbers()
+        # Update text widget
+        self._set_text(formatted)
 
-            self.status_label.configure(text="✓ JSON formatted", text_color=("green", "green"))
+        # Update line numbers
+        self._update_line_numbers()
 
-        except json.JSONDecodeError as e:
-            self.status_label.configure(text=f"✗ Cannot format invalid JSON: {e.msg}", text_color=("red", "red"))
+        self.status_label.configure(text="✓ JSON formatted", text_color=("green", "green"))
 
     def _toggle_token_visibility(self):
         """Toggle visibility of authentication tokens."""
-        content = self.json_text.get("1.0", "end-1c")
+        content = self._get_text()
+        if '"ANTHROPIC_AUTH_TOKEN"' not in content:
+            return
 
-        try:
-            data = json.loads(content)
-
-            if 'env' in data and 'ANTHROPIC_AUTH_TOKEN' in data['env']:
-                token = data['env']['ANTHROPIC_AUTH_TOKEN']
-
-                if self.show_tokens_var.get():
-                    # Show full token
-                    # (Token is already shown)
-                    self.status_label.configure(text="Auth tokens visible", text_color=("orange", "orange"))
-                else:
-                    # Mask token
-                    if token and len(token) > 10:
-                        masked_token = f"{token[:8]}...{token[-4:]}"
-                        data['env']['ANTHROPIC_AUTH_TOKEN'] = masked_token
-                        content = json.dumps(data, indent=2)
-                        self.json_text.delete("1.0", "end")
-                        self.json_text.insert("1.0", content)
-                        self._update_line_numbers()
-
-                    self.status_label.configure(text="Auth tokens masked", text_color=("green", "green"))
-
-        except json.JSONDecodeError:
-            self.status_label.configure(text="Cannot mask tokens in invalid JSON", text_color=("red", "red"))
+        if self.show_tokens_var.get():
+            # Show full token
+            # (Token is already shown)
+            self.status_label.configure(text="Auth tokens visible", text_color=("orange", "orange"))
+            return
+
+        # Mask tokens in place; only the token strings change, so no parse is needed
+        masked, count = _TOKEN_RE.subn(
+            lambda m: f"{m.group(1)}{m.group(2)[:8]}...{m.group(2)[-4:]}{m.group(3)}",
+            content
+        )
+        if count:
+            self._set_text(masked)
+            self._update_line_numbers()
+
+        self.status_label.configure(text="Auth tokens masked", text_color=("green", "green"))
 
     def _validate_form(self) -> bool:
         """Validate form data."""
@@ -388,7 +475,7 @@ class ProfileEditorDialog(ctk.CTkToplevel):
 
         try:
             name = self.name_var.get().strip()
-            config_json = self.json_text.get("1.0", "end-1c")
+            config_json = self._get_text()
 
             # Create profile object
             if self.is_edit_mode:
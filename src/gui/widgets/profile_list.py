@@ -2,10 +2,11 @@
 Profile list widget for displaying and managing configuration profiles.
 """
 
+import bisect
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List, Tuple
 import json
 
 from models.profile import Profile
@@ -13,20 +14,39 @@ from services.profile_service import ProfileService
 from services.config_service import ConfigService
 from utils.logger import get_logger
 from utils.exceptions import ConfigSwitcherError
-from gui.widgets.profile_preview import ProfilePreviewDialog
 
 logger = get_logger(__name__)
 
 class ProfileListWidget(ctk.CTkFrame):
     """Widget for displaying and interacting with profile list."""
 
+    # Row fonts shared by all rows, keyed by (size, weight)
+    _FONTS: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+    # Rows sit in fixed-height slots so only those in view need widgets;
+    # sizes are before widget scaling
+    _ROW_HEIGHT = 190
+    _ROW_PADX = 8
+    _ROW_PADY = 6
+    # Rows built beyond each edge of the viewport
+    _OVERSCAN_ROWS = 2
+
+    # Detail lines under the name: (prefix, font size, text color, pady)
+    _DETAIL_SLOTS = (
+        ("URL", 11, ("#6b7280", "#9ca3af"), 1),
+        ("Token", 11, ("#6b7280", "#9ca3af"), 1),
+        ("Model", 11, ("#6b7280", "#9ca3af"), 1),
+        ("Updated", 10, ("#9ca3af", "#6b7280"), (3, 0)),
+    )
+
     def __init__(
         self,
         parent,
         profile_service: ProfileService,
         config_service: ConfigService,
         on_profile_selected: Optional[Callable[[Profile], None]] = None,
-        on_profile_activated: Optional[Callable[[Profile], None]] = None
+        on_profile_activated: Optional[Callable[[Profile], None]] = None,
+        on_profile_deselected: Optional[Callable[[], None]] = None
     ):
         """
         Initialize profile list widget.
@@ -37,6 +57,7 @@ class ProfileListWidget(ctk.CTkFrame):
             config_service: Configuration service instance
             on_profile_selected: Callback when profile is selected
             on_profile_activated: Callback when profile is activated
+            on_profile_deselected: Callback when the selection is cleared
         """
         super().__init__(parent)
 
@@ -44,22 +65,58 @@ class ProfileListWidget(ctk.CTkFrame):
         self.config_service = config_service
         self.on_profile_selected = on_profile_selected
         self.on_profile_activated = on_profile_activated
+        self.on_profile_deselected = on_profile_deselected
 
         self.profiles: List[Profile] = []
         self.selected_profile: Optional[Profile] = None
 
+        # Positions in self.profiles, rebuilt whenever the list changes
+        self._index_by_id: Dict[int, int] = {}
+        self._index_by_name: Dict[str, int] = {}
+
+        # Row context menu, built on first right-click, and the row it targets
+        self._ctx_menu: Optional[tk.Menu] = None
+        self._ctx_target: Optional[Profile] = None
+
         self._create_widgets()
         self._setup_layout()
 
     def _create_widgets(self):
         """Create widget components."""
-        # Scrollable frame for profile list
-        self.scroll_frame = ctk.CTkScrollableFrame(self)
-
-        # Profile item frames will be added dynamically
-        self.profile_frames: List[ctk.CTkFrame] = []
-
-        # Bind mouse wheel events to the scrollable frame
+        # Rows are windows on a plain canvas; only those in view are built
+        self.canvas = ctk.CTkCanvas(self, highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._update_canvas_color()
+
+        # Built rows, keyed by profile ID
+        self._row_widgets: Dict[int, ctk.CTkFrame] = {}
+        self._row_items: Dict[int, int] = {}
+        self._name_labels: Dict[int, ctk.CTkLabel] = {}
+        # Row frame path -> profile, for the shared row bindings
+        self._row_profiles: Dict[str, Profile] = {}
+        # Row frame path -> (name label, detail labels), for refilling rows
+        self._row_labels: Dict[str, Tuple[ctk.CTkLabel, List[ctk.CTkLabel]]] = {}
+        # Hidden (frame, canvas item) pairs ready to show another profile
+        self._row_pool: List[Tuple[ctk.CTkFrame, int]] = []
+        # (profile ID, finish callback) of an in-place rename in progress
+        self._renaming: Optional[Tuple[int, Callable[[bool], None]]] = None
+
+        # Every widget of every row carries one bindtag, bound once here;
+        # rows cover the canvas, so they forward wheel scrolling too
+        self._row_tag = f"ProfileRow{self}"
+        for sequence, handler in (
+            ("<Button-1>", self._on_row_click),
+            ("<Double-Button-1>", self._on_row_double_click),
+            ("<Button-3>", self._on_row_right_click),
+            ("<MouseWheel>", self._on_mousewheel),
+            ("<Button-4>", self._on_mousewheel_linux),
+            ("<Button-5>", self._on_mousewheel_linux),
+        ):
+            self.bind_class(self._row_tag, sequence, handler)
+
+        # Bind mouse wheel events to the canvas
         self._bind_mousewheel()
 
     def _setup_layout(self):
@@ -67,60 +124,45 @@ class ProfileListWidget(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        self.scroll_frame.grid(row=0, column=0, sticky="nsew")
-
-        # Set a minimum height for the scrollable frame to ensure it's visible
-        self.scroll_frame.configure(height=200)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
 
-    def _bind_mousewheel(self):
-        """Bind mouse wheel events to the scrollable frame."""
-        # Try to access the internal canvas for mouse wheel binding
-        try:
-            # CTkScrollableFrame has an internal _canvas attribute
-            canvas = self.scroll_frame._canvas
+        # Set a minimum height for the list to ensure it's visible
+        self.canvas.configure(height=self._apply_widget_scaling(200))
 
-            # Bind mouse wheel events for Windows
-            canvas.bind("<MouseWheel>", self._on_mousewheel)
+    def _set_appearance_mode(self, mode_string):
+        """Keep the canvas background in step with the frame color."""
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, "canvas"):
+            self._update_canvas_color()
 
-            # Bind mouse wheel events for Linux
-            canvas.bind("<Button-4>", self._on_mousewheel_linux)
-            canvas.bind("<Button-5>", self._on_mousewheel_linux)
+    def _update_canvas_color(self):
+        """Match the canvas background to this frame's color."""
+        color = self.cget("fg_color")
+        if color == "transparent":
+            color = self.cget("bg_color")
+        self.canvas.configure(bg=self._apply_appearance_mode(color))
 
-            # Also bind to the scrollable frame itself
-            self.scroll_frame.bind("<MouseWheel>", self._on_mousewheel)
-            self.scroll_frame.bind("<Button-4>", self._on_mousewheel_linux)
-            self.scroll_frame.bind("<Button-5>", self._on_mousewheel_linux)
+    def _bind_mousewheel(self):
+        """Bind mouse wheel events to the canvas."""
+        # Bind mouse wheel events for Windows
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
 
-        except AttributeError:
-            # If internal canvas is not accessible, just bind to the frame
-            self.scroll_frame.bind("<MouseWheel>", self._on_mousewheel)
-            self.scroll_frame.bind("<Button-4>", self._on_mousewheel_linux)
-            self.scroll_frame.bind("<Button-5>", self._on_mousewheel_linux)
+        # Bind mouse wheel events for Linux
+        self.canvas.bind("<Button-4>", self._on_mousewheel_linux)
+        self.canvas.bind("<Button-5>", self._on_mousewheel_linux)
 
     def _on_mousewheel(self, event):
         """Handle Windows mouse wheel scrolling."""
         try:
-            # Get the internal canvas if available
-            try:
-                canvas = self.scroll_frame._canvas
-            except AttributeError:
-                return
-
-            # Scroll the canvas
             delta = -1 * (event.delta // 120)
-            canvas.yview_scroll(delta, "units")
+            self.canvas.yview_scroll(delta, "units")
         except Exception as e:
             logger.debug(f"Mouse wheel event failed: {e}")
 
     def _on_mousewheel_linux(self, event):
         """Handle Linux mouse wheel scrolling."""
         try:
-            # Get the internal canvas if available
-            try:
-                canvas = self.scroll_frame._canvas
-            except AttributeError:
-                return
-
             # Linux mouse wheel (button 4 = up, button 5 = down)
             if event.num == 4:
                 delta = -1
@@ -129,207 +171,378 @@ class ProfileListWidget(ctk.CTkFrame):
             else:
                 return
 
-            canvas.yview_scroll(delta, "units")
+            self.canvas.yview_scroll(delta, "units")
         except Exception as e:
             logger.debug(f"Linux mouse wheel event failed: {e}")
 
-    def load_profiles(self):
-        """Load and display all profiles."""
-        try:
-            # Clear existing profile frames
-            for frame in self.profile_frames:
-                frame.destroy()
-            self.profile_frames.clear()
+    def _on_yscroll(self, first: str, last: str):
+        """Update the scrollbar and build rows scrolled into view."""
+        self.scrollbar.set(first, last)
+        self._render_visible()
+
+    def _on_canvas_configure(self, event):
+        """Stretch rows to the new width and fill a taller viewport."""
+        width = event.width - 2 * self._apply_widget_scaling(self._ROW_PADX)
+        for item in self._row_items.values():
+            self.canvas.itemconfigure(item, width=width)
+        self._update_scrollregion()
+        self._render_visible()
+
+    def _slot_height(self) -> int:
+        """Return the scaled height of one row slot."""
+        return round(self._apply_widget_scaling(self._ROW_HEIGHT))
+
+    def _update_scrollregion(self):
+        """Size the scroll region to hold every row slot."""
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), len(self.profiles) * self._slot_height())
+        )
+
+    def _render_visible(self):
+        """Build rows inside the viewport (plus overscan) and release the rest to the pool."""
+        slot = self._slot_height()
+        top = self.canvas.canvasy(0)
+        first = max(int(top // slot) - self._OVERSCAN_ROWS, 0)
+        last = min(
+            int((top + self.canvas.winfo_height()) // slot) + self._OVERSCAN_ROWS + 1,
+            len(self.profiles)
+        )
+        wanted = {self.profiles[i].id: i for i in range(first, last)}
+
+        for profile_id in [pid for pid in self._row_widgets if pid not in wanted]:
+            self._destroy_row(profile_id)
+        for profile_id, index in wanted.items():
+            if profile_id not in self._row_widgets:
+                self._build_row(index)
+
+    def _build_row(self, index: int):
+        """Show profiles[index] in its slot, reusing a pooled row if one is free."""
+        profile = self.profiles[index]
+
+        slot = self._slot_height()
+        padx = self._apply_widget_scaling(self._ROW_PADX)
+        pady = self._apply_widget_scaling(self._ROW_PADY)
+        width = self.canvas.winfo_width() - 2 * padx
+        if self._row_pool:
+            frame, item = self._row_pool.pop()
+            self.canvas.coords(item, padx, index * slot + pady)
+            self.canvas.itemconfigure(item, state="normal", width=width)
+        else:
+            frame = self._create_row_widgets()
+            item = self.canvas.create_window(
+                padx, index * slot + pady,
+                anchor="nw",
+                window=frame,
+                width=width,
+                height=slot - 2 * pady
+            )
+
+        self._update_profile_item(frame, profile)
+        self._row_items[profile.id] = item
+        self._row_widgets[profile.id] = frame
+
+    def _destroy_row(self, profile_id: int):
+        """Hide a built row and return it to the pool for reuse."""
+        if self._renaming is not None and self._renaming[0] == profile_id:
+            self._renaming[1](False)
 
-            # Load profiles from service
-            self.profiles = self.profile_service.get_all_profiles()
-            active_profile = self.profile_service.get_active_profile()
+        item = self._row_items.pop(profile_id)
+        frame = self._row_widgets.pop(profile_id)
+        self._row_profiles.pop(str(frame), None)
+        self._name_labels.pop(profile_id, None)
 
-            # Create profile item for each profile
-            for i, profile in enumerate(self.profiles):
-                logger.info(f"Creating profile item {i+1}/{len(self.profiles)}: {profile.name}")
-                profile_frame = self._create_profile_item(profile, active_profile)
-                self.profile_frames.append(profile_frame)
-                logger.info(f"Created profile frame for {profile.name}: {profile_frame}")
+        self.canvas.itemconfigure(item, state="hidden")
+        self._row_pool.append((frame, item))
 
-            logger.info(f"Loaded {len(self.profiles)} profiles, created {len(self.profile_frames)} frames")
+    def _reindex(self):
+        """Rebuild the ID and name lookups into self.profiles."""
+        self._index_by_id = {p.id: i for i, p in enumerate(self.profiles)}
+        self._index_by_name = {p.name: i for i, p in enumerate(self.profiles)}
+
+    def _relayout(self):
+        """Move built rows to their slots after profiles were inserted or removed."""
+        slot = self._slot_height()
+        padx = self._apply_widget_scaling(self._ROW_PADX)
+        pady = self._apply_widget_scaling(self._ROW_PADY)
+        self._reindex()
+        for profile_id, item in self._row_items.items():
+            self.canvas.coords(item, padx, self._index_by_id[profile_id] * slot + pady)
+
+        self._update_scrollregion()
+        self._render_visible()
+
+    def load_profiles(self):
+        """Load and display all profiles."""
+        try:
+            self.render_profiles(*self.fetch_profiles())
 
         except Exception as e:
             logger.error(f"Failed to load profiles: {e}")
             messagebox.showerror("Error", f"Failed to load profiles: {e}")
 
-    def _create_profile_item(self, profile: Profile, active_profile: Optional[Profile]) -> ctk.CTkFrame:
+    def fetch_profiles(self) -> Tuple[List[Profile], Optional[Profile]]:
         """
-        Create a profile item widget.
+        Fetch profiles from the service without touching any widgets.
+
+        Safe to call from a worker thread.
+
+        Returns:
+            Tuple of (all profiles, active profile or None)
+        """
+        return self.profile_service.get_all_profiles(), self.profile_service.get_active_profile()
+
+    def render_profiles(self, profiles: List[Profile], active_profile: Optional[Profile]):
+        """
+        Rebuild the list from already fetched profiles.
+
+        Must be called from the Tk main thread.
 
         Args:
-            profile: Profile data
+            profiles: Profiles to display
             active_profile: Currently active profile
+        """
+        # Return existing rows to the pool
+        for profile_id in list(self._row_widgets):
+            self._destroy_row(profile_id)
+
+        self.profiles = profiles
+        self._reindex()
+
+        # Only rows in view are built; the rest are built as they scroll in
+        self._update_scrollregion()
+        self._render_visible()
+
+        logger.info(f"Loaded {len(self.profiles)} profiles, showing {len(self._row_widgets)} rows")
+
+    def add_row(self, profile: Profile):
+        """
+        Insert a row for a profile without rebuilding the rest of the list.
+
+        Args:
+            profile: Profile to add; the list stays sorted by name
+        """
+        index = bisect.bisect_right(self.profiles, profile.name, key=lambda p: p.name)
+        self.profiles.insert(index, profile)
+        self._relayout()
+
+    def update_row(self, profile_id: int, profile: Profile):
+        """
+        Replace the row of an existing profile with fresh data.
+
+        Args:
+            profile_id: ID of the profile to update
+            profile: Updated profile data
+        """
+        was_selected = self._drop_row(profile_id)
+        self.add_row(profile)
+        if was_selected:
+            self._select_profile(profile)
+
+    def remove_row(self, profile_id: int):
+        """
+        Remove the row of a profile.
+
+        Args:
+            profile_id: ID of the profile to remove
+        """
+        was_selected = self._drop_row(profile_id)
+        self._relayout()
+        if was_selected:
+            self.selected_profile = None
+            if self.on_profile_deselected:
+                self.on_profile_deselected()
+
+    def begin_rename(self, profile_id: int, initial_text: str, on_commit: Callable[[str], None]):
+        """
+        Edit a name in place by swapping the row's name label for an entry.
+
+        Return or focus loss commits, Escape cancels.
+
+        Args:
+            profile_id: ID of the profile whose row hosts the entry
+            initial_text: Text the entry starts with, fully selected
+            on_commit: Called with the stripped text if it is not empty
+        """
+        if self._renaming is not None:
+            return  # One rename at a time
+
+        if profile_id not in self._name_labels:
+            # Bring the row into view so it gets built
+            index = self._index_by_id.get(profile_id)
+            if index is None:
+                return
+            self.scroll_to_profile(self.profiles[index])
+        label = self._name_labels.get(profile_id)
+        if label is None:
+            return
+
+        entry = ctk.CTkEntry(label.master)
+        entry.insert(0, initial_text)
+        entry.pack(fill="x", pady=(0, 3), before=label)
+        label.pack_forget()
+
+        # Drop the toplevel tag so window shortcuts such as <Delete> and
+        # <Control-d> don't fire while typing; class bindings still edit text
+        inner = entry._entry
+        toplevel = str(inner.winfo_toplevel())
+        inner.bindtags(tuple(tag for tag in inner.bindtags() if tag != toplevel))
+
+        def finish(commit: bool):
+            if not entry.winfo_exists():
+                return  # Already finished
+            self._renaming = None
+            text = entry.get().strip()
+            label.pack(fill="x", pady=(0, 3), before=entry)
+            entry.destroy()
+            if commit and text:
+                on_commit(text)
+
+        entry.bind("<Return>", lambda e: finish(True))
+        entry.bind("<FocusOut>", lambda e: finish(True))
+        entry.bind("<Escape>", lambda e: finish(False))
+        entry.select_range(0, "end")
+        entry.focus_set()
+        self._renaming = (profile_id, finish)
+
+    def _drop_row(self, profile_id: int) -> bool:
+        """Remove a profile and its row if built; returns True if it was the selected one."""
+        index = self._index_by_id.get(profile_id)
+        if index is None:
+            return False
+
+        # Callers relayout afterwards, which reindexes
+        del self.profiles[index]
+        if profile_id in self._row_widgets:
+            self._destroy_row(profile_id)
+
+        return self.selected_profile is not None and self.selected_profile.id == profile_id
+
+    @classmethod
+    def _font(cls, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Return a shared font, creating it on first use."""
+        font = cls._FONTS.get((size, weight))
+        if font is None:
+            font = cls._FONTS[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
+    def _create_row_widgets(self) -> ctk.CTkFrame:
+        """
+        Create an empty row; _update_profile_item() fills it in.
 
         Returns:
-            Profile item frame
+            Row frame
         """
-        # Main frame for profile item with border effect
+        # Main frame for profile item with border effect; the caller places it
         item_frame = ctk.CTkFrame(
-            self.scroll_frame,
+            self.canvas,
             corner_radius=8,
             border_width=2
         )
-        logger.info(f"Created frame for profile {profile.name}")
-
-        # Increased vertical padding for better separation
-        item_frame.pack(fill="x", padx=8, pady=6)
-        logger.info(f"Packed frame for profile {profile.name}")
-
-        # Configure frame appearance based on active status
-        if profile.is_active:
-            # Active profile: green border and subtle background
-            item_frame.configure(
-                fg_color=("#1a4d2e", "#0f3a1f"),
-                border_color=("#22c55e", "#16a34a")
-            )
 
         # Profile info frame
         info_frame = ctk.CTkFrame(item_frame)
-        info_frame.pack(fill="x", padx=10, pady=8)
 
         # Name label
-        name_text = profile.name
-        if profile.is_active:
-            name_text = f"✓ {name_text}"  # Add checkmark for active
-
-        name_label = ctk.CTkLabel(
-            info_frame,
-            text=name_text,
-            font=ctk.CTkFont(size=14, weight="bold" if profile.is_active else "normal"),
-            anchor="w"
-        )
-        name_label.pack(fill="x", pady=(0, 3))
+        name_label = ctk.CTkLabel(info_frame, text="", anchor="w")
 
-        # Details frame
+        # Details frame, with one label per detail line
         details_frame = ctk.CTkFrame(info_frame)
+        detail_labels = [
+            ctk.CTkLabel(details_frame, text="", font=self._font(size), anchor="w", text_color=color)
+            for _, size, color, _ in self._DETAIL_SLOTS
+        ]
+
+        # Pack everything in one pass once all children exist; the row's size
+        # is fixed by its canvas slot, so nothing needs to propagate upwards.
+        # Detail labels are packed per profile.
+        item_frame.pack_propagate(False)
+        info_frame.pack(fill="x", padx=10, pady=8)
+        name_label.pack(fill="x", pady=(0, 3))
         details_frame.pack(fill="x")
 
-        # Base URL
-        base_url = profile.get_base_url()
-        if base_url:
-            base_url_label = ctk.CTkLabel(
-                details_frame,
-                text=f"URL: {base_url}",
-                font=ctk.CTkFont(size=11),
-                anchor="w",
-                text_color=("#6b7280", "#9ca3af")
-            )
-            base_url_label.pack(fill="x", pady=1)
-
-        # Auth token (masked)
-        auth_token = profile.get_auth_token_masked()
-        if auth_token:
-            token_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Token: {auth_token}",
-                font=ctk.CTkFont(size=11),
-                anchor="w",
-                text_color=("#6b7280", "#9ca3af")
-            )
-            token_label.pack(fill="x", pady=1)
-
-        # Model
-        model = profile.get_model()
-        if model:
-            model_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Model: {model}",
-                font=ctk.CTkFont(size=11),
-                anchor="w",
-                text_color=("#6b7280", "#9ca3af")
-            )
-            model_label.pack(fill="x", pady=1)
-
-        # Updated timestamp
-        if profile.updated_at:
-            updated_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Updated: {profile.updated_at.strftime('%Y-%m-%d %H:%M')}",
-                font=ctk.CTkFont(size=10),
-                anchor="w",
-                text_color=("#9ca3af", "#6b7280")
-            )
-            updated_label.pack(fill="x", pady=(3, 0))
-
-        # Bind events
-        self._bind_profile_events(item_frame, profile)
+        self._row_labels[str(item_frame)] = (name_label, detail_labels)
+        self._add_row_tag(item_frame)
 
         return item_frame
 
-    def _bind_profile_events(self, frame: ctk.CTkFrame, profile: Profile):
-        """Bind events to profile item."""
-        def on_click(event):
-            self._select_profile(profile)
+    def _update_profile_item(self, frame: ctk.CTkFrame, profile: Profile):
+        """
+        Show a profile in an existing row.
 
-        def on_double_click(event):
-            self._activate_profile(profile)
+        Args:
+            frame: Row frame from _create_row_widgets()
+            profile: Profile data
+        """
+        name_label, detail_labels = self._row_labels[str(frame)]
 
-        def on_right_click(event):
-            # Show context menu
-            self._show_context_menu(event, profile)
+        # Add checkmark for active
+        name_label.configure(
+            text=f"✓ {profile.name}" if profile.is_active else profile.name,
+            font=self._font(14, "bold" if profile.is_active else "normal")
+        )
 
-        # Bind click and double-click events
-        frame.bind("<Button-1>", on_click)
-        frame.bind("<Double-Button-1>", on_double_click)
-        frame.bind("<Button-3>", on_right_click)  # Right-click
+        base_url, auth_token, model = profile.get_display_fields()
+        updated = profile.updated_at.strftime('%Y-%m-%d %H:%M') if profile.updated_at else ""
+        values = (base_url, auth_token, model, updated)
 
-        # Bind events to all child widgets
-        for widget in frame.winfo_children():
-            self._bind_recursive(widget, on_click, on_double_click, on_right_click)
+        # Repack only the lines this profile has, keeping their order
+        for label in detail_labels:
+            label.pack_forget()
+        for label, value, (prefix, _, _, pady) in zip(detail_labels, values, self._DETAIL_SLOTS):
+            if value:
+                label.configure(text=f"{prefix}: {value}")
+                label.pack(fill="x", pady=pady)
 
-    def _bind_recursive(self, widget, on_click, on_double_click, on_right_click):
-        """Recursively bind events to widget and its children."""
-        try:
-            widget.bind("<Button-1>", on_click)
-            widget.bind("<Double-Button-1>", on_double_click)
-            widget.bind("<Button-3>", on_right_click)
-        except:
-            pass  # Some widgets don't support binding
+        selected = self.selected_profile is not None and self.selected_profile.id == profile.id
+        self._style_row(frame, profile.is_active, selected)
+
+        self._row_profiles[str(frame)] = profile
+        self._name_labels[profile.id] = name_label
 
+    def _add_row_tag(self, widget):
+        """Recursively put the row bindtag first on widget and its children."""
+        widget.bindtags((self._row_tag,) + widget.bindtags())
         for child in widget.winfo_children():
-            self._bind_recursive(child, on_click, on_double_click, on_right_click)
+            self._add_row_tag(child)
+
+    def _row_profile(self, widget) -> Optional[Profile]:
+        """Return the profile of the row containing widget, if any."""
+        while widget is not None:
+            profile = self._row_profiles.get(str(widget))
+            if profile is not None:
+                return profile
+            widget = widget.master
+        return None
+
+    def _on_row_click(self, event):
+        """Select the clicked row."""
+        profile = self._row_profile(event.widget)
+        if profile is not None:
+            self._select_profile(profile)
+
+    def _on_row_double_click(self, event):
+        """Activate the double-clicked row."""
+        profile = self._row_profile(event.widget)
+        if profile is not None:
+            self._activate_profile(profile)
+
+    def _on_row_right_click(self, event):
+        """Show the context menu for the right-clicked row."""
+        profile = self._row_profile(event.widget)
+        if profile is not None:
+            self._show_context_menu(event, profile)
 
     def _select_profile(self, profile: Profile):
         """Handle profile selection."""
-        # Clear previous selection - reset all frames to default state
-        for i, p in enumerate(self.profiles):
-            if i < len(self.profile_frames) and self.profile_frames[i].winfo_exists():
-                if p.is_active:
-                    # Active profile: green border and subtle background
-                    self.profile_frames[i].configure(
-                        fg_color=("#1a4d2e", "#0f3a1f"),
-                        border_color=("#22c55e", "#16a34a")
-                    )
-                else:
-                    # Inactive profile: no highlight, use default theme color for border
-                    self.profile_frames[i].configure(
-                        fg_color="transparent",
-                        border_color=("#3a3a3a", "#2b2b2b")
-                    )
+        # Clear previous selection; rows scrolled out of view have no widgets
+        previous = self.selected_profile
+        if previous is not None and previous.id in self._row_widgets:
+            self._style_row(self._row_widgets[previous.id], previous.is_active, selected=False)
 
         # Highlight selected profile with blue border
-        for i, p in enumerate(self.profiles):
-            if p.id == profile.id:
-                if i < len(self.profile_frames) and self.profile_frames[i].winfo_exists():
-                    if p.is_active:
-                        # Selected + Active: both green background and blue border
-                        self.profile_frames[i].configure(
-                            fg_color=("#1a4d2e", "#0f3a1f"),
-                            border_color=("#3b82f6", "#2563eb")
-                        )
-                    else:
-                        # Selected only: blue border and light background
-                        self.profile_frames[i].configure(
-                            fg_color=("#1e3a5f", "#172a46"),
-                            border_color=("#3b82f6", "#2563eb")
-                        )
-                break
+        frame = self._row_widgets.get(profile.id)
+        if frame is not None:
+            self._style_row(frame, profile.is_active, selected=True)
 
         self.selected_profile = profile
 
@@ -339,6 +552,21 @@ class ProfileListWidget(ctk.CTkFrame):
 
         logger.debug(f"Selected profile: {profile.name}")
 
+    def _style_row(self, frame: ctk.CTkFrame, is_active: bool, selected: bool):
+        """Set a row's colors from its active and selected state."""
+        if selected and is_active:
+            # Selected + Active: both green background and blue border
+            frame.configure(fg_color=("#1a4d2e", "#0f3a1f"), border_color=("#3b82f6", "#2563eb"))
+        elif selected:
+            # Selected only: blue border and light background
+            frame.configure(fg_color=("#1e3a5f", "#172a46"), border_color=("#3b82f6", "#2563eb"))
+        elif is_active:
+            # Active profile: green border and subtle background
+            frame.configure(fg_color=("#1a4d2e", "#0f3a1f"), border_color=("#22c55e", "#16a34a"))
+        else:
+            # Inactive profile: no highlight, use default theme color for border
+            frame.configure(fg_color="transparent", border_color=("#3a3a3a", "#2b2b2b"))
+
     def _activate_profile(self, profile: Profile):
         """Handle profile activation (double-click)."""
         if profile.is_active:
@@ -370,8 +598,8 @@ class ProfileListWidget(ctk.CTkFrame):
                     # Reload profiles to update display
                     self.load_profiles()
 
-                    # Re-select the activated profile
-                    self._select_profile(profile)
+                    # Re-select the reloaded instance, which is now marked active
+                    self.select_profile_by_id(profile.id)
 
                     # Notify parent
                     if self.on_profile_activated:
@@ -415,11 +643,11 @@ class ProfileListWidget(ctk.CTkFrame):
         Returns:
             True if profile found and selected
         """
-        for profile in self.profiles:
-            if profile.id == profile_id:
-                self._select_profile(profile)
-                return True
-        return False
+        index = self._index_by_id.get(profile_id)
+        if index is None:
+            return False
+        self._select_profile(self.profiles[index])
+        return True
 
     def select_profile_by_name(self, name: str) -> bool:
         """
@@ -431,11 +659,11 @@ class ProfileListWidget(ctk.CTkFrame):
         Returns:
             True if profile found and selected
         """
-        for profile in self.profiles:
-            if profile.name == name:
-                self._select_profile(profile)
-                return True
-        return False
+        index = self._index_by_name.get(name)
+        if index is None:
+            return False
+        self._select_profile(self.profiles[index])
+        return True
 
     def get_profile_count(self) -> int:
         """
@@ -454,63 +682,64 @@ class ProfileListWidget(ctk.CTkFrame):
             profile: Profile to scroll to
         """
         try:
-            # Find profile frame
-            for i, p in enumerate(self.profiles):
-                if p.id == profile.id and i < len(self.profile_frames):
-                    frame = self.profile_frames[i]
-                    # Calculate scroll position
-                    frame_y = frame.winfo_y()
-                    canvas = self.scroll_frame._canvas
-                    canvas_height = canvas.winfo_height()
-                    scroll_position = frame_y / canvas_height
-                    canvas.yview_moveto(scroll_position)
-                    break
+            index = self._index_by_id[profile.id]
+            self.canvas.yview_moveto(index / len(self.profiles))
+            # Build the rows now rather than when the scroll callback runs
+            self._render_visible()
         except Exception as e:
             logger.debug(f"Failed to scroll to profile: {e}")
 
     def _show_context_menu(self, event, profile: Profile):
         """Show context menu for profile."""
         try:
-            import tkinter as tk
-
-            # Create context menu
-            context_menu = tk.Menu(self, tearoff=0)
-
-            # Add menu items
-            context_menu.add_command(
-                label="Preview Profile",
-                command=lambda: self._preview_profile(profile)
-            )
-            context_menu.add_separator()
-            context_menu.add_command(
-                label="Activate Profile",
-                command=lambda: self._activate_profile(profile)
-            )
-            context_menu.add_command(
-                label="Edit Profile",
-                command=lambda: self._edit_profile(profile)
-            )
-            context_menu.add_separator()
-            context_menu.add_command(
-                label="Duplicate Profile",
-                command=lambda: self._duplicate_profile(profile)
-            )
-            context_menu.add_command(
-                label="Delete Profile",
-                command=lambda: self._delete_profile(profile)
-            )
+            # Built on first use; the commands act on whichever row was clicked last
+            if self._ctx_menu is None:
+                self._ctx_menu = self._build_context_menu()
+            self._ctx_target = profile
 
             # Show menu at cursor position
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                self._ctx_menu.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                self._ctx_menu.grab_release()
 
         except Exception as e:
             logger.error(f"Failed to show context menu: {e}")
 
+    def _build_context_menu(self) -> tk.Menu:
+        """Create the row context menu."""
+        context_menu = tk.Menu(self, tearoff=0)
+
+        # Add menu items
+        context_menu.add_command(
+            label="Preview Profile",
+            command=lambda: self._preview_profile(self._ctx_target)
+        )
+        context_menu.add_separator()
+        context_menu.add_command(
+            label="Activate Profile",
+            command=lambda: self._activate_profile(self._ctx_target)
+        )
+        context_menu.add_command(
+            label="Edit Profile",
+            command=lambda: self._edit_profile(self._ctx_target)
+        )
+        context_menu.add_separator()
+        context_menu.add_command(
+            label="Duplicate Profile",
+            command=lambda: self._duplicate_profile(self._ctx_target)
+        )
+        context_menu.add_command(
+            label="Delete Profile",
+            command=lambda: self._delete_profile(self._ctx_target)
+        )
+
+        return context_menu
+
     def _preview_profile(self, profile: Profile):
         """Show profile preview dialog."""
+        from gui.widgets.profile_preview import ProfilePreviewDialog
+
         try:
             dialog = ProfilePreviewDialog(self, profile)
             # Dialog is modal, no need to wait_window
@@ -5,8 +5,9 @@ Simple profile list widget using basic tkinter components.
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List, Set, Tuple
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from models.profile import Profile
 from services.profile_service import ProfileService
@@ -16,9 +17,28 @@ from utils.exceptions import ConfigSwitcherError
 
 logger = get_logger(__name__)
 
+# Text colors (light, dark) of the detail and timestamp labels
+_DETAIL_COLOR = ("#6b7280", "#9ca3af")
+_TIMESTAMP_COLOR = ("#9ca3af", "#6b7280")
+
 class SimpleProfileListWidget(ctk.CTkFrame):
     """Simple profile list widget using basic tkinter components."""
 
+    # Unscaled height of one profile row; rows are laid out at index * height.
+    # The name and four detail labels need about 150 px including padding
+    _ROW_HEIGHT = 160
+
+    # Rows kept built beyond each edge of the viewport
+    _OVERSCAN_ROWS = 1
+
+    # Item frame color by item state
+    _ITEM_COLORS = {
+        "selected_active": ("#1e40af", "#1e3a8a"),  # Blue highlight for active
+        "selected": ("#dc2626", "#991b1b"),  # Red highlight for selected
+        "active": ("#2b2b2b", "#212121"),  # Active profile gets special color
+        "normal": "transparent",  # Non-active items become transparent
+    }
+
     def __init__(
         self,
         parent,
@@ -47,11 +67,30 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         self.profiles: List[Profile] = []
         self.selected_profile: Optional[Profile] = None
 
+        # IDs of active profiles, and (name, URL, token, model, updated) text
+        # per profile ID, both reset on every load
+        self._active_ids: Set[int] = set()
+        self._display_cache: Dict[int, Tuple[str, str, str, str, str]] = {}
+
+        # Positions in self.profiles, rebuilt on every load
+        self._index_by_id: Dict[int, int] = {}
+        self._index_by_name: Dict[str, int] = {}
+
+        # Backups and settings writes run off the Tk thread, one at a time
+        self._activation_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_activation: Optional[Future] = None
+
         self._create_widgets()
         self._setup_layout()
 
     def _create_widgets(self):
         """Create widget components."""
+        # Fonts shared by every item
+        self._font_name_active = ctk.CTkFont(size=14, weight="bold")
+        self._font_name = ctk.CTkFont(size=14, weight="normal")
+        self._font_detail = ctk.CTkFont(size=11)
+        self._font_timestamp = ctk.CTkFont(size=10)
+
         # Title label
         self.title_label = ctk.CTkLabel(
             self,
@@ -63,18 +102,11 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         self.canvas = tk.Canvas(self, bg="#212121", highlightthickness=0)
         self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
 
-        # Connect canvas to scrollbar
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Profile items container - inside canvas
-        self.profile_frame = ctk.CTkFrame(self.canvas)
-        self.canvas_window = self.canvas.create_window(
-            (0, 0), window=self.profile_frame, anchor="nw"
-        )
+        # Connect canvas to scrollbar; every scroll also brings rows into view
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
 
         # Bind events
         self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.profile_frame.bind("<Configure>", self._on_profile_frame_configure)
 
         # Bind mouse wheel events for scrolling
         # Windows uses <MouseWheel>
@@ -82,16 +114,37 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         self.canvas.bind("<Button-4>", self._on_mousewheel_linux)  # Linux scroll up
         self.canvas.bind("<Button-5>", self._on_mousewheel_linux)  # Linux scroll down
 
-        # Also bind mouse wheel to the frame for better coverage
-        self.profile_frame.bind("<MouseWheel>", self._on_mousewheel_windows)
-        self.profile_frame.bind("<Button-4>", self._on_mousewheel_linux)
-        self.profile_frame.bind("<Button-5>", self._on_mousewheel_linux)
-
-        # Bind to all child widgets recursively for complete coverage
-        self.canvas.bind("<Configure>", lambda e: self._bind_mousewheel_to_children())
-
-        # Profile items
-        self.profile_items: List[ctk.CTkFrame] = []
+        # Item frames shown on the canvas, keyed by index into self.profiles
+        self._visible: Dict[int, ctk.CTkFrame] = {}
+        # Hidden item frames ready to show another profile
+        self._item_pool: List[ctk.CTkFrame] = []
+        # Shown item frame path -> profile, for the shared item bindings
+        self._item_profiles: Dict[str, Profile] = {}
+
+        # Every widget of every item carries one bindtag, bound once here;
+        # items cover the canvas, so they forward wheel scrolling too
+        self._item_tag = f"ProfileItem{self}"
+        for sequence, handler in (
+            ("<Button-1>", self._on_item_click),
+            ("<Double-Button-1>", self._on_item_double_click),
+            ("<MouseWheel>", self._on_mousewheel_windows),
+            ("<Button-4>", self._on_mousewheel_linux),
+            ("<Button-5>", self._on_mousewheel_linux),
+        ):
+            self.bind_class(self._item_tag, sequence, handler)
+
+        # Canvas width the items were last stretched to
+        self._last_canvas_width = -1
+
+        # Wheel units not scrolled yet, and the callback that will scroll them
+        self._wheel_accum = 0
+        self._wheel_after_id: Optional[str] = None
+
+        # Last scroll region set on the canvas
+        self._last_scrollregion: Optional[Tuple[int, int, int, int]] = None
+
+        # Pending idle callback that recomputes the scroll region
+        self._scroll_region_after_id: Optional[str] = None
 
     def _setup_layout(self):
         """Setup widget layout."""
@@ -111,45 +164,43 @@ class SimpleProfileListWidget(ctk.CTkFrame):
 
     def _on_canvas_configure(self, event):
         """Handle canvas resize."""
-        # Update the profile frame width to match canvas width
+        # Stretch the visible items to the canvas width, unless only the
+        # height changed (or the event repeats the current size)
         canvas_width = event.width
-        if canvas_width > 1:
+        if canvas_width > 1 and canvas_width != self._last_canvas_width:
+            self._last_canvas_width = canvas_width
             # Since canvas is in column 0 with weight=1, it fills available space
             # The scrollbar is in column 1, so canvas automatically excludes scrollbar width
-            self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            for item in self._visible.values():
+                self.canvas.itemconfig(item.window_id, width=canvas_width)
             logger.debug(f"Canvas resized to width: {canvas_width}")
 
-        # Update scroll region to include all content
-        self._update_scroll_region()
+            # Update scroll region to include all content
+            self._request_scroll_region_update()
+
+        # A taller viewport may show more rows
+        self._reconcile_visible()
 
-    def _on_profile_frame_configure(self, event):
-        """Handle profile frame resize."""
-        # Update scroll region when profile frame changes
-        logger.debug(f"Profile frame resized, height: {event.height}")
+    def _on_yscroll(self, first: str, last: str):
+        """Update the scrollbar and show the items scrolled into view."""
+        self.scrollbar.set(first, last)
+        self._reconcile_visible()
+
+    def _request_scroll_region_update(self):
+        """Recompute the scroll region once the current burst of events is handled."""
+        if self._scroll_region_after_id is None:
+            self._scroll_region_after_id = self.after_idle(self._flush_scroll_region)
+
+    def _flush_scroll_region(self):
+        """Run the scroll region update requested since the last flush."""
+        self._scroll_region_after_id = None
         self._update_scroll_region()
 
     def _update_scroll_region(self):
-        """Update the canvas scroll region to include all content."""
+        """Update the canvas scroll region to hold every row."""
         try:
-            # Force update of all widgets
-            self.update_idletasks()
-            self.profile_frame.update_idletasks()
-
-            # Get the actual height of the profile frame
-            frame_height = self.profile_frame.winfo_height()
-            if frame_height <= 0:
-                # If frame height is not available, calculate based on items
-                frame_height = 0
-                for item in self.profile_items:
-                    if item.winfo_exists():
-                        item.update_idletasks()
-                        item_height = item.winfo_height()
-                        if item_height > 0:
-                            frame_height += item_height + 2
-                        else:
-                            frame_height += 120
-                    else:
-                        frame_height += 120
+            # Rows have a fixed height, so no item needs to exist to size the list
+            frame_height = len(self.profiles) * self._slot_height()
 
             # Get canvas dimensions
             canvas_width = self.canvas.winfo_width()
@@ -160,19 +211,62 @@ class SimpleProfileListWidget(ctk.CTkFrame):
             if frame_height < 400:
                 frame_height = 400
 
-            # Set scroll region with actual dimensions
-            self.canvas.configure(scrollregion=(0, 0, canvas_width, frame_height))
-            logger.debug(f"Updated scroll region: 0,0,{canvas_width},{frame_height}")
+            # Set scroll region with actual dimensions; reconfiguring it makes
+            # the canvas redraw, so skip it when nothing changed
+            scrollregion = (0, 0, canvas_width, frame_height)
+            if scrollregion != self._last_scrollregion:
+                self._last_scrollregion = scrollregion
+                self.canvas.configure(scrollregion=scrollregion)
+                logger.debug(f"Updated scroll region: 0,0,{canvas_width},{frame_height}")
 
         except Exception as e:
             logger.error(f"Failed to update scroll region: {e}")
-            # Fallback: force a reasonable scroll region
-            try:
-                fallback_height = max(600, len(self.profile_items) * 120)
-                self.canvas.configure(scrollregion=(0, 0, 400, fallback_height))
-                logger.debug(f"Using fallback scroll region: 0,0,400,{fallback_height}")
-            except Exception as fallback_e:
-                logger.error(f"Fallback scroll region failed: {fallback_e}")
+
+    def _slot_height(self) -> int:
+        """Return the row height scaled like the labels inside it."""
+        return round(self._apply_widget_scaling(self._ROW_HEIGHT))
+
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        """Resize and re-place every item when the widget scaling changes."""
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        slot = self._slot_height()
+        for item in self._item_pool:
+            self.canvas.itemconfig(item.window_id, height=slot - 2)
+        for index, item in self._visible.items():
+            self.canvas.itemconfig(item.window_id, height=slot - 2)
+            self.canvas.coords(item.window_id, 0, index * slot)
+        self._update_scroll_region()
+        self._reconcile_visible()
+
+    def _reconcile_visible(self):
+        """Show items for the rows in the viewport and pool the rest."""
+        slot = self._slot_height()
+        top = self.canvas.canvasy(0)
+        first = max(int(top // slot) - self._OVERSCAN_ROWS, 0)
+        last = min(
+            int((top + self.canvas.winfo_height()) // slot) + self._OVERSCAN_ROWS + 1,
+            len(self.profiles)
+        )
+
+        for index in [i for i in self._visible if not first <= i < last]:
+            self._release_item(index)
+
+        canvas_width = self.canvas.winfo_width()
+        for index in range(first, last):
+            if index in self._visible:
+                continue
+            item = self._item_pool.pop() if self._item_pool else self._create_item_frame()
+            self.canvas.coords(item.window_id, 0, index * slot)
+            self.canvas.itemconfig(item.window_id, state="normal", width=canvas_width)
+            self._bind_profile_item(item, self.profiles[index])
+            self._visible[index] = item
+
+    def _release_item(self, index: int):
+        """Hide the item shown for a row and return it to the pool."""
+        item = self._visible.pop(index)
+        del self._item_profiles[str(item)]
+        self.canvas.itemconfig(item.window_id, state="hidden")
+        self._item_pool.append(item)
 
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
@@ -186,7 +280,7 @@ class SimpleProfileListWidget(ctk.CTkFrame):
                 delta = -1 * (event.delta // 120)
 
             # Scroll the canvas
-            self.canvas.yview_scroll(delta, "units")
+            self._queue_wheel_scroll(delta)
         except Exception as e:
             logger.debug(f"Mouse wheel event failed: {e}")
 
@@ -195,7 +289,7 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         try:
             # Windows mouse wheel
             delta = -1 * (event.delta // 120)
-            self.canvas.yview_scroll(delta, "units")
+            self._queue_wheel_scroll(delta)
         except Exception as e:
             logger.debug(f"Windows mouse wheel event failed: {e}")
 
@@ -209,47 +303,40 @@ class SimpleProfileListWidget(ctk.CTkFrame):
                 delta = 1
             else:
                 return
-            self.canvas.yview_scroll(delta, "units")
+            self._queue_wheel_scroll(delta)
         except Exception as e:
             logger.debug(f"Linux mouse wheel event failed: {e}")
 
-    def _bind_mousewheel_to_children(self):
-        """Recursively bind mouse wheel events to all child widgets."""
-        def bind_to_widget(widget):
-            try:
-                widget.bind("<MouseWheel>", self._on_mousewheel_windows)
-                widget.bind("<Button-4>", self._on_mousewheel_linux)
-                widget.bind("<Button-5>", self._on_mousewheel_linux)
-
-                # Recursively bind to children
-                for child in widget.winfo_children():
-                    bind_to_widget(child)
-            except:
-                pass  # Some widgets don't support binding
-
-        bind_to_widget(self.profile_frame)
+    def _queue_wheel_scroll(self, delta: int):
+        """Add wheel units to scroll; all units queued within one frame scroll at once."""
+        self._wheel_accum += delta
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Scroll the canvas by the wheel units queued since the last flush."""
+        self._wheel_after_id = None
+        delta, self._wheel_accum = self._wheel_accum, 0
+        if delta:
+            self.canvas.yview_scroll(delta, "units")
 
     def load_profiles(self):
         """Load and display all profiles."""
         try:
-            # Clear existing profile items
-            for item in self.profile_items:
-                item.destroy()
-            self.profile_items.clear()
+            # Return the shown items to the pool
+            for index in list(self._visible):
+                self._release_item(index)
 
             # Load profiles from service
             self.profiles = self.profile_service.get_all_profiles()
-            active_profile = self.profile_service.get_active_profile()
-
-            # Create profile item for each profile
-            for profile in self.profiles:
-                profile_item = self._create_profile_item(profile, active_profile)
-                self.profile_items.append(profile_item)
+            self._active_ids = {p.id for p in self.profiles if p.is_active}
+            self._index_by_id = {p.id: i for i, p in enumerate(self.profiles)}
+            self._index_by_name = {p.name: i for i, p in enumerate(self.profiles)}
+            self._display_cache.clear()
 
-            # Update scroll region after all profiles are added with multiple attempts
-            self.after(50, self._update_scroll_region)
-            self.after(200, self._update_scroll_region)
-            self.after(500, self._update_scroll_region)
+            # Only the rows in view get an item
+            self._reconcile_visible()
+            self._request_scroll_region_update()
 
             logger.info(f"Loaded {len(self.profiles)} profiles")
 
@@ -257,160 +344,178 @@ class SimpleProfileListWidget(ctk.CTkFrame):
             logger.error(f"Failed to load profiles: {e}")
             messagebox.showerror("Error", f"Failed to load profiles: {e}")
 
-    def _create_profile_item(self, profile: Profile, active_profile: Optional[Profile]) -> ctk.CTkFrame:
+    def _create_item_frame(self) -> ctk.CTkFrame:
         """
-        Create a profile item widget.
-
-        Args:
-            profile: Profile data
-            active_profile: Currently active profile
+        Create an empty profile item; _bind_profile_item() fills it in.
 
         Returns:
-            Profile item frame
+            Profile item frame, placed on the canvas but hidden
         """
-        # Main frame for profile item
-        item_frame = ctk.CTkFrame(self.profile_frame)
-        item_frame.pack(fill="x", padx=2, pady=1)  # Small padding for visual separation
-        # Configure frame to fill width completely
-        item_frame.pack_configure(fill="x", expand=True)
-
-        # Store profile ID in frame for easy identification
-        item_frame.profile_id = profile.id
-
-        # Configure frame appearance based on active status
-        if profile.is_active:
-            item_frame.configure(fg_color=("#2b2b2b", "#212121"))  # Highlight active
-
-        # Profile info frame
-        info_frame = ctk.CTkFrame(item_frame)
-        info_frame.pack(fill="x", padx=2, pady=2)  # Small internal padding
-        # Configure info_frame to fill width completely
-        info_frame.pack_configure(fill="x", expand=True)
+        # Main frame for profile item, sized by its canvas window; its labels
+        # sit directly on it in one grid column, without nested frames
+        item_frame = ctk.CTkFrame(self.canvas)
+        item_frame.grid_propagate(False)
+        item_frame.grid_columnconfigure(0, weight=1)
+        item_frame.window_id = self.canvas.create_window(
+            0, 0, window=item_frame, anchor="nw",
+            height=self._slot_height() - 2, state="hidden"
+        )
+        item_frame.profile_id = None
+        item_frame.style_state = None
 
         # Name label
-        name_text = profile.name
-        if profile.is_active:
-            name_text = f"✓ {name_text}"  # Add checkmark for active
-
-        name_label = ctk.CTkLabel(
-            info_frame,
-            text=name_text,
-            font=ctk.CTkFont(size=14, weight="bold" if profile.is_active else "normal"),
-            anchor="w"
-        )
-        name_label.pack(fill="x", pady=(0, 1))
-
-        # Details frame
-        details_frame = ctk.CTkFrame(info_frame)
-        details_frame.pack(fill="x")
-
-        # Base URL
-        base_url = profile.get_base_url()
-        if base_url:
-            base_url_label = ctk.CTkLabel(
-                details_frame,
-                text=f"URL: {base_url}",
-                font=ctk.CTkFont(size=11),
-                anchor="w",
-                text_color=("#6b7280", "#9ca3af")
-            )
-            base_url_label.pack(fill="x", pady=1)
-
-        # Auth token (masked)
-        auth_token = profile.get_auth_token_masked()
-        if auth_token:
-            token_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Token: {auth_token}",
-                font=ctk.CTkFont(size=11),
-                anchor="w",
-                text_color=("#6b7280", "#9ca3af")
-            )
-            token_label.pack(fill="x", pady=1)
-
-        # Model
-        model = profile.get_model()
-        if model:
-            model_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Model: {model}",
-                font=ctk.CTkFont(size=11),
+        item_frame.name_label = ctk.CTkLabel(item_frame, text="", anchor="w")
+        item_frame.name_label.grid(row=0, column=0, sticky="ew", padx=4, pady=(2, 1))
+
+        # URL, token, model and updated labels, one grid row each; rows of
+        # labels removed with grid_remove() collapse to nothing
+        item_frame.detail_labels = []
+        for row in range(1, 5):
+            is_timestamp = row == 4
+            label = ctk.CTkLabel(
+                item_frame,
+                text="",
+                font=self._font_timestamp if is_timestamp else self._font_detail,
                 anchor="w",
-                text_color=("#6b7280", "#9ca3af")
+                text_color=_TIMESTAMP_COLOR if is_timestamp else _DETAIL_COLOR
             )
-            model_label.pack(fill="x", pady=1)
-
-        # Updated timestamp
-        if profile.updated_at:
-            updated_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Updated: {profile.updated_at.strftime('%Y-%m-%d %H:%M')}",
-                font=ctk.CTkFont(size=10),
-                anchor="w",
-                text_color=("#9ca3af", "#6b7280")
-            )
-            updated_label.pack(fill="x", pady=(1, 0))
+            label.grid(row=row, column=0, sticky="ew", padx=4, pady=(1, 0) if is_timestamp else 1)
+            item_frame.detail_labels.append(label)
 
         # Bind events
-        self._bind_profile_events(item_frame, profile)
+        self._add_item_tag(item_frame)
 
         return item_frame
 
-    def _bind_profile_events(self, frame: ctk.CTkFrame, profile: Profile):
-        """Bind events to profile item."""
-        def on_click(event):
-            self._select_profile(profile)
+    def _bind_profile_item(self, item_frame: ctk.CTkFrame, profile: Profile):
+        """
+        Show a profile in an existing item frame.
 
-        def on_double_click(event):
-            self._activate_profile(profile)
+        Args:
+            item_frame: Frame from _create_item_frame()
+            profile: Profile data
+        """
+        # Store profile ID in frame for easy identification
+        item_frame.profile_id = profile.id
+        self._item_profiles[str(item_frame)] = profile
 
-        # Bind click and double-click events
-        frame.bind("<Button-1>", on_click)
-        frame.bind("<Double-Button-1>", on_double_click)
+        name_text, base_url, auth_token, model, updated = self._display_fields(profile)
 
-        # Bind events to all child widgets
-        self._bind_recursive(frame, on_click, on_double_click)
+        # Name label
+        item_frame.name_label.configure(
+            text=name_text,
+            font=self._font_name_active if profile.is_active else self._font_name
+        )
 
-    def _bind_recursive(self, widget, on_click, on_double_click):
-        """Recursively bind events to widget and its children."""
-        try:
-            widget.bind("<Button-1>", on_click)
-            widget.bind("<Double-Button-1>", on_double_click)
-        except:
-            pass  # Some widgets don't support binding
+        # Base URL, auth token (masked), model and updated timestamp
+        details = (
+            ("URL", base_url),
+            ("Token", auth_token),
+            ("Model", model),
+            ("Updated", updated),
+        )
+        for label, (prefix, value) in zip(item_frame.detail_labels, details):
+            if value:
+                label.configure(text=f"{prefix}: {value}")
+                label.grid()
+            else:
+                label.grid_remove()
+
+        # Configure frame appearance based on active and selected status
+        self._style_item(item_frame, profile.id)
+
+    def _style_item(self, item_frame: ctk.CTkFrame, profile_id: int):
+        """
+        Color an item frame for the active and selected state of its profile.
+
+        Args:
+            item_frame: Frame showing the profile
+            profile_id: ID of the profile it shows
+        """
+        is_active = profile_id in self._active_ids
+        if self.selected_profile is not None and self.selected_profile.id == profile_id:
+            state = "selected_active" if is_active else "selected"
+        else:
+            state = "active" if is_active else "normal"
+
+        # Recoloring makes CustomTkinter redraw the frame, so skip no-op changes
+        if item_frame.style_state != state:
+            item_frame.style_state = state
+            item_frame.configure(fg_color=self._ITEM_COLORS[state])
+
+    def _shown_item(self, profile_id: int) -> Optional[ctk.CTkFrame]:
+        """Return the item frame showing a profile, or None if it is out of view."""
+        index = self._index_by_id.get(profile_id)
+        return self._visible.get(index) if index is not None else None
+
+    def _display_fields(self, profile: Profile) -> Tuple[str, str, str, str, str]:
+        """
+        Return the texts an item shows for a profile, computed once per load.
+
+        Args:
+            profile: Profile data
 
+        Returns:
+            Tuple of (name text, base URL, masked token, model, updated time);
+            missing values are empty strings
+        """
+        fields = self._display_cache.get(profile.id)
+        if fields is None:
+            name_text = f"✓ {profile.name}" if profile.is_active else profile.name  # Add checkmark for active
+            base_url, auth_token, model = profile.get_display_fields()
+            updated = ""
+            if profile.updated_at:
+                # Same as strftime('%Y-%m-%d %H:%M'), without the format parsing
+                dt = profile.updated_at
+                updated = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+            fields = (name_text, base_url or "", auth_token or "", model or "", updated)
+            self._display_cache[profile.id] = fields
+        return fields
+
+    def _add_item_tag(self, widget):
+        """Recursively put the item bindtag first on widget and its children."""
+        widget.bindtags((self._item_tag,) + widget.bindtags())
         for child in widget.winfo_children():
-            self._bind_recursive(child, on_click, on_double_click)
+            self._add_item_tag(child)
+
+    def _item_profile(self, widget) -> Optional[Profile]:
+        """Return the profile shown by the item containing widget, if any."""
+        while widget is not None:
+            profile = self._item_profiles.get(str(widget))
+            if profile is not None:
+                return profile
+            widget = widget.master
+        return None
+
+    def _on_item_click(self, event):
+        """Select the clicked item."""
+        profile = self._item_profile(event.widget)
+        if profile:
+            self._select_profile(profile)
+
+    def _on_item_double_click(self, event):
+        """Activate the double-clicked item."""
+        profile = self._item_profile(event.widget)
+        if profile:
+            self._activate_profile(profile)
 
     def _select_profile(self, profile: Profile):
         """Handle profile selection."""
-        # Clear previous selection from all items
-        for item in self.profile_items:
-            if hasattr(item, 'profile_id'):
-                # Reset to default or active styling
-                is_active = any(p.id == item.profile_id and p.is_active for p in self.profiles)
-                if is_active:
-                    # Active profile gets special color
-                    item.configure(fg_color=("#2b2b2b", "#212121"))
-                else:
-                    # Non-active items become transparent
-                    item.configure(fg_color="transparent")
-
-        # Highlight selected profile with strong color
-        for item in self.profile_items:
-            if hasattr(item, 'profile_id') and item.profile_id == profile.id:
-                # Check if this profile is active
-                is_active = any(p.id == profile.id and p.is_active for p in self.profiles)
-                if is_active:
-                    # Active profile gets different highlight
-                    item.configure(fg_color=("#1e40af", "#1e3a8a"))  # Blue highlight for active
-                else:
-                    # Selected non-active profile gets strong highlight
-                    item.configure(fg_color=("#dc2626", "#991b1b"))  # Red highlight for selected
-                break
+        if profile is self.selected_profile:
+            return  # Already selected and styled
 
+        previous = self.selected_profile
         self.selected_profile = profile
 
+        # Restyle only the previously and newly selected items, if shown
+        if previous is not None:
+            item = self._shown_item(previous.id)
+            if item is not None:
+                self._style_item(item, previous.id)
+        item = self._shown_item(profile.id)
+        if item is not None:
+            self._style_item(item, profile.id)
+
         # Notify parent
         if self.on_profile_selected:
             self.on_profile_selected(profile)
@@ -422,6 +527,9 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         if profile.is_active:
             logger.info(f"Profile '{profile.name}' is already active")
             return
+        if self._pending_activation is not None:
+            logger.info(f"Ignoring activation of '{profile.name}' while another is in progress")
+            return
 
         try:
             # Confirm activation
@@ -430,46 +538,95 @@ class SimpleProfileListWidget(ctk.CTkFrame):
                 f"Apply profile '{profile.name}' to Claude Code configuration?\n\n"
                 "This will replace your current configuration and create a backup."
             ):
-                # Create backup
-                try:
-                    backup_path = self.config_service.create_backup()
-                    logger.info(f"Created backup: {backup_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to create backup: {e}")
-
-                # Apply profile configuration
-                config_json = profile.config_json
-                success = self.config_service.write_settings(config_json)
-
-                if success:
-                    # Update active status in database
-                    self.profile_service.set_active_profile(profile.id)
-
-                    # Reload profiles to update display
-                    self.load_profiles()
-
-                    # Re-select the activated profile
-                    self._select_profile(profile)
-
-                    # Notify parent
-                    if self.on_profile_activated:
-                        self.on_profile_activated(profile)
-
-                    messagebox.showinfo(
-                        "Success",
-                        f"Profile '{profile.name}' has been activated successfully."
-                    )
-                    logger.info(f"Activated profile: {profile.name}")
-                else:
-                    messagebox.showerror(
-                        "Error",
-                        "Failed to apply profile configuration."
-                    )
+                # Back up and write the settings file in a worker thread
+                self._pending_activation = self._activation_executor.submit(self._write_profile, profile)
+                self.after(20, self._poll_activation, self._pending_activation, profile)
 
         except Exception as e:
             logger.error(f"Failed to activate profile '{profile.name}': {e}")
             messagebox.showerror("Error", f"Failed to activate profile: {e}")
 
+    def _write_profile(self, profile: Profile) -> bool:
+        """
+        Back up the current settings and write the profile's configuration.
+
+        Runs in the activation worker thread and touches no widgets.
+
+        Args:
+            profile: Profile to apply
+
+        Returns:
+            True if the settings were written
+        """
+        # Create backup
+        try:
+            backup_path = self.config_service.create_backup()
+            logger.info(f"Created backup: {backup_path}")
+        except Exception as e:
+            logger.warning(f"Failed to create backup: {e}")
+
+        # Apply profile configuration
+        return self.config_service.write_settings(profile.config_json)
+
+    def _poll_activation(self, future: Future, profile: Profile):
+        """Finish an activation once the worker is done (runs on the Tk thread)."""
+        if not future.done():
+            self.after(20, self._poll_activation, future, profile)
+            return
+
+        self._pending_activation = None
+
+        try:
+            if future.result():
+                # Update active status in database
+                self.profile_service.set_active_profile(profile.id)
+
+                # Move the active marker instead of reloading every profile
+                self._mark_active(profile)
+
+                # Re-select the activated profile
+                self._select_profile(profile)
+
+                # Notify parent
+                if self.on_profile_activated:
+                    self.on_profile_activated(profile)
+
+                messagebox.showinfo(
+                    "Success",
+                    f"Profile '{profile.name}' has been activated successfully."
+                )
+                logger.info(f"Activated profile: {profile.name}")
+            else:
+                messagebox.showerror(
+                    "Error",
+                    "Failed to apply profile configuration."
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to activate profile '{profile.name}': {e}")
+            messagebox.showerror("Error", f"Failed to activate profile: {e}")
+
+    def _mark_active(self, profile: Profile):
+        """
+        Make profile the only active one and restyle just the changed items.
+
+        Args:
+            profile: Newly activated profile
+        """
+        changed = self._active_ids | {profile.id}
+        for profile_id in changed:
+            index = self._index_by_id.get(profile_id)
+            if index is not None:
+                self.profiles[index].is_active = profile_id == profile.id
+            self._display_cache.pop(profile_id, None)
+        profile.is_active = True
+        self._active_ids = {profile.id}
+
+        for profile_id in changed:
+            item = self._shown_item(profile_id)
+            if item is not None:
+                self._bind_profile_item(item, self.profiles[self._index_by_id[profile_id]])
+
     def get_selected_profile(self) -> Optional[Profile]:
         """
         Get currently selected profile.
@@ -493,11 +650,11 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         Returns:
             True if profile found and selected
         """
-        for profile in self.profiles:
-            if profile.id == profile_id:
-                self._select_profile(profile)
-                return True
-        return False
+        index = self._index_by_id.get(profile_id)
+        if index is None:
+            return False
+        self._select_profile(self.profiles[index])
+        return True
 
     def select_profile_by_name(self, name: str) -> bool:
         """
@@ -509,11 +666,11 @@ class SimpleProfileListWidget(ctk.CTkFrame):
         Returns:
             True if profile found and selected
         """
-        for profile in self.profiles:
-            if profile.name == name:
-                self._select_profile(profile)
-                return True
-        return False
+        index = self._index_by_name.get(name)
+        if index is None:
+            return False
+        self._select_profile(self.profiles[index])
+        return True
 
     def get_profile_count(self) -> int:
         """
@@ -3,10 +3,11 @@ Profile preview dialog for viewing formatted JSON configurations.
 """
 
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from tkinter import messagebox
 import customtkinter as ctk
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from models.profile import Profile
 from services.validation_service import ValidationService
@@ -14,9 +15,27 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# orjson is optional; both paths produce 2-space indented, key-sorted JSON
+# with non-ASCII characters written as-is rather than \uXXXX-escaped
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_sorted(obj: Any) -> str:
+        """Pretty-print with sorted keys using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+    _dumps_sorted = json.JSONEncoder(ensure_ascii=False, indent=2, sort_keys=True).encode
+
 class ProfilePreviewDialog(ctk.CTkToplevel):
     """Dialog for previewing profile configurations."""
 
+    # (plain, masked) pretty-printed JSON by content hash, shared by all dialogs
+    _json_cache: Dict[str, Tuple[str, str]] = {}
+    _JSON_CACHE_SIZE = 32
+
     def __init__(
         self,
         parent,
@@ -36,6 +55,9 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
         self.profile = profile
         self.show_secrets = show_secrets
 
+        # Pending gutter redraw
+        self._ln_after_id: Optional[str] = None
+
         self._setup_dialog()
         self._create_widgets()
         self._load_profile_data()
@@ -43,7 +65,6 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
     def _setup_dialog(self):
         """Setup dialog properties."""
         self.title(f"Profile Preview: {self.profile.name}")
-        self.geometry("800x600")
         self.resizable(True, True)
 
         # Minimum size
@@ -53,15 +74,23 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
         self.transient(self.master)
         self.grab_set()
 
-        # Center dialog on parent
-        self._center_dialog()
+        # Size and center dialog
+        self._center_dialog(800, 600)
 
-    def _center_dialog(self):
-        """Center dialog on parent window."""
-        self.update_idletasks()
-        x = (self.master.winfo_screenwidth() // 2) - (self.winfo_width() // 2)
-        y = (self.master.winfo_screenheight() // 2) - (self.winfo_height() // 2)
-        self.geometry(f"+{x}+{y}")
+    def _center_dialog(self, width: int, height: int):
+        """
+        Size the dialog and center it on the screen with a single geometry call.
+
+        The position comes from the requested size, so no layout pass has to
+        run first to measure the window.
+
+        Args:
+            width: Dialog width before window scaling
+            height: Dialog height before window scaling
+        """
+        x = max((self.master.winfo_screenwidth() - round(self._apply_window_scaling(width))) // 2, 0)
+        y = max((self.master.winfo_screenheight() - round(self._apply_window_scaling(height))) // 2, 0)
+        self.geometry(f"{width}x{height}+{x}+{y}")
 
     def _create_widgets(self):
         """Create dialog widgets."""
@@ -133,21 +162,24 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
         json_display_frame = ctk.CTkFrame(config_frame)
         json_display_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
 
-        # Line numbers
-        self.line_numbers = ctk.CTkTextbox(
-            json_display_frame,
-            width=50,
-            font=ctk.CTkFont(family="Consolas, monospace", size=11)
-        )
+        # Line numbers, drawn on a plain canvas for the visible lines only
+        self.line_numbers = tk.Canvas(json_display_frame, highlightthickness=0)
         self.line_numbers.pack(side="left", fill="y")
-        self.line_numbers.configure(state="disabled")
 
-        # JSON text display
+        # JSON text display; without wrapping, Tk only lays out the lines in
+        # view and each JSON line stays one display line next to its number
         self.json_text = ctk.CTkTextbox(
             json_display_frame,
-            font=ctk.CTkFont(family="Consolas, monospace", size=11)
+            font=ctk.CTkFont(family="Consolas, monospace", size=11),
+            wrap="none"
         )
         self.json_text.pack(side="left", fill="both", expand=True)
+        self.line_numbers.configure(width=round(self.json_text._apply_widget_scaling(50)))
+        self._update_gutter_colors()
+
+        # Redraw the gutter whenever the text view moves, then pass the
+        # update on to the textbox's own scrollbar
+        self.json_text._textbox.configure(yscrollcommand=self._on_json_yscroll)
 
         # Validation and info frame
         info_frame = ctk.CTkFrame(main_frame)
@@ -162,7 +194,7 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
         self.validation_label.pack(anchor="w", padx=15, pady=(10, 5))
 
         # Sensitive data warning
-        sensitive_data = ValidationService.detect_sensitive_data(self.profile.config_json)
+        sensitive_data = ValidationService.detect_cached_sensitive_data(self.profile.config_json)
         if sensitive_data:
             warning_label = ctk.CTkLabel(
                 info_frame,
@@ -211,19 +243,41 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
     # Syntax highlighting removed - CustomTkinter CTkTextbox doesn't support tagging
 
     def _load_profile_data(self):
-        """Load profile data into dialog."""
+        """Load profile data into dialog, formatting uncached JSON in a worker thread."""
+        if self._json_cache_key() in self._json_cache:
+            self._show_profile_data()
+            return
+
+        # Show the dialog right away and format in the background
+        self.json_text.insert("1.0", "Loading configuration...")
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._format_json, self.profile.config_json)
+        executor.shutdown(wait=False)
+        self.after(20, self._poll_formatted_json, future)
+
+    def _poll_formatted_json(self, future: Future):
+        """Display the JSON once the worker has formatted it (runs on the Tk thread)."""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(20, self._poll_formatted_json, future)
+            return
+
         try:
-            # Parse and format JSON
-            config_data = json.loads(self.profile.config_json)
-            formatted_json = json.dumps(config_data, indent=2, sort_keys=True)
+            self._cache_formatted_json(future.result())
+        except Exception as e:
+            logger.error(f"Failed to load profile data: {e}")
+            self.json_text.delete("1.0", "end")
+            self.json_text.insert("1.0", f"Error loading configuration: {e}")
+            return
 
-            # Mask sensitive data if needed
-            if not self.show_secrets:
-                formatted_json = ValidationService.mask_sensitive_data(formatted_json)
+        self._show_profile_data()
 
+    def _show_profile_data(self):
+        """Display the formatted JSON and its validation status."""
+        try:
             # Display JSON
-            self.json_text.insert("1.0", formatted_json)
-            self._update_line_numbers()
+            self._show_json()
 
             # Perform basic validation
             self._show_validation_status()
@@ -232,48 +286,111 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
             logger.error(f"Failed to load profile data: {e}")
             self.json_text.insert("1.0", f"Error loading configuration: {e}")
 
+    @staticmethod
+    def _format_json(config_json: str) -> Tuple[str, str]:
+        """
+        Pretty-print a configuration; touches no widgets, so safe in a worker thread.
+
+        Args:
+            config_json: Configuration JSON string
+
+        Returns:
+            Tuple of (plain JSON, JSON with sensitive data masked)
+        """
+        # Parse and format JSON
+        config_data = _loads(config_json)
+        masked_data = ValidationService.mask_sensitive_dict(config_data)
+        return _dumps_sorted(config_data), _dumps_sorted(masked_data)
+
+    def _json_cache_key(self) -> str:
+        """Return the key of this profile's entry in _json_cache."""
+        return self.profile.content_hash or self.profile.config_json
+
+    def _cache_formatted_json(self, formatted: Tuple[str, str]):
+        """Store this profile's formatted JSON in the shared cache."""
+        cache = ProfilePreviewDialog._json_cache
+        if len(cache) >= self._JSON_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Drop the oldest entry
+        cache[self._json_cache_key()] = formatted
+
+    def _get_formatted_json(self) -> Tuple[str, str]:
+        """
+        Get the pretty-printed configuration, formatted once per content.
+
+        Returns:
+            Tuple of (plain JSON, JSON with sensitive data masked)
+        """
+        formatted = self._json_cache.get(self._json_cache_key())
+        if formatted is None:
+            formatted = self._format_json(self.profile.config_json)
+            self._cache_formatted_json(formatted)
+        return formatted
+
+    def _show_json(self):
+        """Display the formatted JSON, masking sensitive data if needed."""
+        plain, masked = self._get_formatted_json()
+        formatted_json = plain if self.show_secrets else masked
+        self.json_text.delete("1.0", "end")
+        self.json_text.insert("1.0", formatted_json)
+        self._schedule_line_numbers()
+
+    def _schedule_line_numbers(self):
+        """Refresh the gutter once, however many times this is called within a frame."""
+        if self._ln_after_id is None:
+            self._ln_after_id = self.after(16, self._update_line_numbers)
+
+    def _on_json_yscroll(self, first: str, last: str):
+        """Keep the gutter in step with the JSON text view."""
+        self.json_text._y_scrollbar.set(first, last)
+        self._schedule_line_numbers()
+
     def _update_line_numbers(self):
-        """Update line numbers display."""
-        content = self.json_text.get("1.0", "end-1c")
-        lines = content.split('\n')
-        line_numbers = '\n'.join(str(i + 1) for i in range(len(lines)))
-
-        self.line_numbers.configure(state="normal")
-        self.line_numbers.delete("1.0", "end")
-        self.line_numbers.insert("1.0", line_numbers)
-        self.line_numbers.configure(state="disabled")
-
-    # Syntax highlighting methods removed - CustomTkinter doesn't support tagging
-
-    def _get_string_length(self, content, current_pos):
-        """Get the length of the current string."""
-        # Find the last unmatched quote
-        string_start = current_pos - 1
-        while string_start >= 0:
-            if content[string_start] == '"':
-                # Check if it's escaped
-                escaped = False
-                escape_check = string_start - 1
-                while escape_check >= 0 and content[escape_check] == '\\':
-                    escaped = not escaped
-                    escape_check -= 1
-                if not escaped:
-                    break
-            string_start -= 1
-        return current_pos - string_start
-
-    def _get_keyword_at_position(self, content, pos):
-        """Get keyword at position."""
-        keywords = ['true', 'false', 'null']
-        for keyword in keywords:
-            if content.startswith(keyword, pos):
-                return keyword
-        return ''
+        """Draw the numbers of the lines currently visible in the JSON text."""
+        self._ln_after_id = None
+        if not self.winfo_exists():
+            return
+        self.line_numbers.delete("all")
+
+        text = self.json_text._textbox
+        font = text.cget("font")
+        x = self.line_numbers.winfo_width() - 4
+        y_offset = text.winfo_y()
+
+        index = text.index("@0,0")
+        while True:
+            info = text.dlineinfo(index)
+            if info is None:
+                break  # Below the visible area
+            self.line_numbers.create_text(
+                x, y_offset + info[1],
+                anchor="ne",
+                text=index.split(".")[0],
+                font=font,
+                fill=self._gutter_fg
+            )
+            next_index = text.index(f"{index} +1 line")
+            if next_index == index:
+                break  # Last line
+            index = next_index
+
+    def _update_gutter_colors(self):
+        """Match the gutter to the JSON textbox colors."""
+        # Resolve against the dialog's mode: the dialog is notified of a mode
+        # change before the textbox, which still holds the old one here
+        self._gutter_fg = self._apply_appearance_mode(self.json_text.cget("text_color"))
+        self.line_numbers.configure(bg=self._apply_appearance_mode(self.json_text.cget("fg_color")))
+
+    def _set_appearance_mode(self, mode_string):
+        """Recolor the gutter along with the rest of the dialog."""
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, "line_numbers"):
+            self._update_gutter_colors()
+            self._schedule_line_numbers()
 
     def _show_validation_status(self):
         """Show validation status."""
         try:
-            validation_summary = ValidationService.get_validation_summary(
+            validation_summary = ValidationService.get_cached_validation_summary(
                 self.profile.name,
                 self.profile.config_json
             )
@@ -309,16 +426,18 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
             text="Hide Sensitive Data" if self.show_secrets else "Show Sensitive Data"
         )
 
-        # Reload JSON content
-        self.json_text.delete("1.0", "end")
-        self._load_profile_data()
+        # Show the other cached variant of the JSON
+        try:
+            self._show_json()
+        except Exception as e:
+            logger.error(f"Failed to load profile data: {e}")
+            self.json_text.insert("1.0", f"Error loading configuration: {e}")
 
     def _copy_json(self):
         """Copy JSON to clipboard."""
         try:
             # Get original JSON (unmasked)
-            config_data = json.loads(self.profile.config_json)
-            formatted_json = json.dumps(config_data, indent=2, sort_keys=True)
+            formatted_json = self._get_formatted_json()[0]
 
             # Copy to clipboard
             self.clipboard_clear()
@@ -336,7 +455,7 @@ class ProfilePreviewDialog(ctk.CTkToplevel):
     def _validate_configuration(self):
         """Validate configuration and show detailed results."""
         try:
-            validation_summary = ValidationService.get_validation_summary(
+            validation_summary = ValidationService.get_cached_validation_summary(
                 self.profile.name,
                 self.profile.config_json
             )
@@ -6,7 +6,7 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Any
 
 from models.config import AppConfig
 from utils.logger import get_logger
@@ -15,6 +15,12 @@ from utils.exceptions import ConfigSwitcherError
 
 logger = get_logger(__name__)
 
+# orjson is optional; only parsing is needed here
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 class SettingsDialog(ctk.CTkToplevel):
     """Settings dialog for application configuration."""
 
@@ -41,6 +47,9 @@ class SettingsDialog(ctk.CTkToplevel):
         self.app_config_path = app_config_path
         self.result = False
 
+        # (path, mtime_ns, parsed JSON) of the last Claude settings file read
+        self._claude_config_cache: Optional[Tuple[Path, int, Any]] = None
+
         self._setup_dialog()
         self._create_widgets()
         self._load_current_settings()
@@ -48,22 +57,20 @@ class SettingsDialog(ctk.CTkToplevel):
     def _setup_dialog(self):
         """Setup dialog properties."""
         self.title("Settings")
-        self.geometry("600x500")
         self.resizable(False, False)
 
         # Make dialog modal
         self.transient(self.master)
         self.grab_set()
 
-        # Center dialog on parent
-        self._center_dialog()
+        # Size and center dialog
+        self._center_dialog(600, 500)
 
-    def _center_dialog(self):
-        """Center dialog on parent window."""
-        self.update_idletasks()
-        x = (self.master.winfo_screenwidth() // 2) - (self.winfo_width() // 2)
-        y = (self.master.winfo_screenheight() // 2) - (self.winfo_height() // 2)
-        self.geometry(f"+{x}+{y}")
+    def _center_dialog(self, width: int, height: int):
+        """Set the dialog to width x height (unscaled) and center it on screen in one call."""
+        x = max((self.master.winfo_screenwidth() - round(self._apply_window_scaling(width))) // 2, 0)
+        y = max((self.master.winfo_screenheight() - round(self._apply_window_scaling(height))) // 2, 0)
+        self.geometry(f"{width}x{height}+{x}+{y}")
 
     def _create_widgets(self):
         """Create dialog widgets."""
@@ -297,13 +304,8 @@ class SettingsDialog(ctk.CTkToplevel):
                 self.status_label.configure(text="Settings file not found", text_color=("red", "red"))
                 return
 
-            # Try to read the file
-            with open(claude_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Validate JSON
-            import json
-            json.loads(content)
+            # Try to read the file and validate JSON
+            self._read_claude_config(claude_path)
 
             self.status_label.configure(text="Connection successful", text_color=("green", "green"))
             logger.info(f"Successfully tested connection to {claude_path}")
@@ -312,6 +314,27 @@ class SettingsDialog(ctk.CTkToplevel):
             self.status_label.configure(text=f"Connection failed: {str(e)}", text_color=("red", "red"))
             logger.error(f"Connection test failed: {e}")
 
+    def _read_claude_config(self, claude_path: Path) -> Any:
+        """
+        Read and parse a Claude settings file, reusing the last result while it is unchanged.
+
+        Args:
+            claude_path: Path to the settings file
+
+        Returns:
+            Parsed JSON content
+        """
+        mtime = claude_path.stat().st_mtime_ns
+        cached = self._claude_config_cache
+        if cached is not None and cached[0] == claude_path and cached[1] == mtime:
+            return cached[2]
+
+        # Both parsers take UTF-8 bytes directly, skipping a text-mode decode
+        parsed = _loads(claude_path.read_bytes())
+
+        self._claude_config_cache = (claude_path, mtime, parsed)
+        return parsed
+
     def _reset_to_defaults(self):
         """Reset settings to default values."""
         if messagebox.askyesno(
@@ -352,10 +375,7 @@ class SettingsDialog(ctk.CTkToplevel):
                 return False
 
             # Validate JSON content
-            with open(claude_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            import json
-            json.loads(content)
+            self._read_claude_config(claude_path)
 
             return True
 
@@ -45,8 +45,12 @@ class AppConfig:
         """
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
+
+            # Atomic write: temp file + rename
+            temp_path = file_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, file_path)
             return True
         except Exception:
             return False
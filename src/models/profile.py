@@ -4,9 +4,9 @@ Profile data model for configuration management.
 
 import json
 import hashlib
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 @dataclass
@@ -20,6 +20,10 @@ class Profile:
     is_active: bool = False
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # (config_json, parsed dict) from the last get_config_dict() call
+    _parsed_config: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (config_json, display fields) from the last get_display_fields() call
+    _display_fields: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Profile':
@@ -102,13 +106,23 @@ class Profile:
         """
         Parse and return configuration as dictionary.
 
+        The parsed result is cached until config_json changes, so the
+        display accessors below share a single parse.
+
         Returns:
             Parsed configuration dictionary
         """
+        cached = self._parsed_config
+        if cached is not None and cached[0] is self.config_json:
+            return cached[1]
+
         try:
-            return json.loads(self.config_json)
+            config = json.loads(self.config_json)
         except json.JSONDecodeError:
-            return {}
+            config = {}
+
+        self._parsed_config = (self.config_json, config)
+        return config
 
     def update_config(self, config_json: str) -> None:
         """
@@ -154,6 +168,23 @@ class Profile:
         config = self.get_config_dict()
         return config.get('model', '')
 
+    def get_display_fields(self) -> Tuple[str, str, str]:
+        """
+        Get the fields shown in profile lists.
+
+        Cached until config_json changes, like get_config_dict().
+
+        Returns:
+            Tuple of (base URL, masked auth token, model)
+        """
+        cached = self._display_fields
+        if cached is not None and cached[0] is self.config_json:
+            return cached[1]
+
+        fields = (self.get_base_url(), self.get_auth_token_masked(), self.get_model())
+        self._display_fields = (self.config_json, fields)
+        return fields
+
     def validate(self) -> List[str]:
         """
         Validate profile data.
@@ -4,7 +4,7 @@ Profile service for profile CRUD operations.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, NamedTuple
 
 from models.profile import Profile
 from storage.database import Database
@@ -16,6 +16,12 @@ from utils.exceptions import (
 
 logger = get_logger(__name__)
 
+class ProfileSnapshot(NamedTuple):
+    """Profile count and active profile name, read together."""
+
+    profile_count: int
+    active_name: Optional[str]
+
 class ProfileService:
     """Service for managing configuration profiles."""
 
@@ -363,6 +369,20 @@ class ProfileService:
             logger.error(f"Failed to search profiles: {e}")
             raise DatabaseError("ProfileService", "search_profiles", str(e))
 
+    def get_snapshot(self) -> ProfileSnapshot:
+        """
+        Get the profile count and active profile name in a single round-trip.
+
+        Returns:
+            Profile snapshot
+        """
+        try:
+            return ProfileSnapshot(**self.database.get_status_snapshot())
+
+        except Exception as e:
+            logger.error(f"Failed to get profile snapshot: {e}")
+            raise DatabaseError("ProfileService", "get_snapshot", str(e))
+
     def get_profile_count(self) -> int:
         """
         Get total number of profiles.
@@ -371,7 +391,7 @@ class ProfileService:
             Number of profiles
         """
         try:
-            return len(self.database.get_all_profiles())
+            return self.database.get_status_snapshot()['profile_count']
 
         except Exception as e:
             logger.error(f"Failed to get profile count: {e}")
@@ -4,6 +4,7 @@ Validation service for JSON configurations and profile data.
 
 import json
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 
 from utils.logger import get_logger
@@ -25,6 +26,14 @@ class ValidationService:
         r'key\s*[:=]\s*[^\s,}]+',       # Key fields
     ]
 
+    # SENSITIVE_PATTERNS compiled once, in the same order
+    _SENSITIVE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in SENSITIVE_PATTERNS]
+
+    # For parsed data: keys whose string values are masked whole, and
+    # key-like substrings masked in any other string value
+    SENSITIVE_KEY_RE = re.compile(r'password|secret|token|key|authorization', re.IGNORECASE)
+    SENSITIVE_VALUE_RE = re.compile(r'sk-[a-zA-Z0-9_-]+|[a-zA-Z0-9_-]{20,}')
+
     @staticmethod
     def validate_json_syntax(json_str: str) -> List[str]:
         """
@@ -199,9 +208,9 @@ class ValidationService:
         """
         sensitive_items = []
 
-        for pattern in ValidationService.SENSITIVE_PATTERNS:
-            matches = re.finditer(pattern, json_str, re.IGNORECASE)
-            for match in matches:
+        for regex in ValidationService._SENSITIVE_RES:
+            pattern = regex.pattern
+            for match in regex.finditer(json_str):
                 # Get context around the match
                 start = max(0, match.start() - 50)
                 end = min(len(json_str), match.end() + 50)
@@ -255,11 +264,7 @@ class ValidationService:
         sensitive_items.sort(key=lambda x: x['start'], reverse=True)
 
         for item in sensitive_items:
-            match = item['match']
-            if len(match) > visible_chars * 2:
-                masked_value = f"{match[:visible_chars]}...{match[-visible_chars:]}"
-            else:
-                masked_value = f"{match[:visible_chars]}..."
+            masked_value = ValidationService._mask_value(item['match'], visible_chars)
 
             # Replace the sensitive data
             start = item['start']
@@ -268,6 +273,46 @@ class ValidationService:
 
         return masked_json
 
+    @staticmethod
+    def mask_sensitive_dict(data: Any, visible_chars: int = 8) -> Any:
+        """
+        Mask sensitive values in parsed JSON data.
+
+        Unlike mask_sensitive_data(), keys are never masked and the result can
+        be serialized directly.
+
+        Args:
+            data: Parsed JSON value
+            visible_chars: Number of characters to show at beginning and end
+
+        Returns:
+            Copy of data with sensitive string values masked
+        """
+        def mask(value: Any, sensitive_key: bool) -> Any:
+            if isinstance(value, dict):
+                return {
+                    k: mask(v, bool(ValidationService.SENSITIVE_KEY_RE.search(k)))
+                    for k, v in value.items()
+                }
+            if isinstance(value, list):
+                return [mask(v, sensitive_key) for v in value]
+            if isinstance(value, str):
+                if sensitive_key:
+                    return ValidationService._mask_value(value, visible_chars)
+                return ValidationService.SENSITIVE_VALUE_RE.sub(
+                    lambda m: ValidationService._mask_value(m.group(), visible_chars), value
+                )
+            return value
+
+        return mask(data, False)
+
+    @staticmethod
+    def _mask_value(value: str, visible_chars: int) -> str:
+        """Keep the first and last visible_chars characters of a sensitive value."""
+        if len(value) > visible_chars * 2:
+            return f"{value[:visible_chars]}...{value[-visible_chars:]}"
+        return f"{value[:visible_chars]}..."
+
     @staticmethod
     def validate_profile_completeness(profile_data: Dict[str, Any]) -> List[str]:
         """
@@ -304,6 +349,37 @@ class ValidationService:
 
         return warnings
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_cached_validation_summary(name: str, config_json: str) -> Dict[str, Any]:
+        """
+        Like get_validation_summary(), but computed once per name and content.
+
+        The result is shared between callers and must not be modified.
+
+        Args:
+            name: Profile name
+            config_json: JSON configuration string
+
+        Returns:
+            Validation summary dictionary
+        """
+        return ValidationService.get_validation_summary(name, config_json)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def detect_cached_sensitive_data(json_str: str) -> Tuple[Dict[str, Any], ...]:
+        """
+        Like detect_sensitive_data(), but computed once per content.
+
+        Args:
+            json_str: JSON string to scan
+
+        Returns:
+            Tuple of detected sensitive data items, which must not be modified
+        """
+        return tuple(ValidationService.detect_sensitive_data(json_str))
+
     @staticmethod
     def get_validation_summary(
         name: str,
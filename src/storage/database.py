@@ -78,6 +78,10 @@ class Database:
                 timeout=30.0
             )
             self._local.connection.row_factory = sqlite3.Row
+            # WAL lets the loader thread read while the UI thread writes
+            self._local.connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection.execute("PRAGMA temp_store=MEMORY")
 
         try:
             yield self._local.connection
@@ -186,6 +190,23 @@ class Database:
 
         return dict(row) if row else None
 
+    def get_status_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the profile count and active profile name in one query.
+
+        Returns:
+            Dictionary with 'profile_count' and 'active_name' (None if no active profile)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) AS profile_count,
+                       (SELECT name FROM profiles WHERE is_active = TRUE) AS active_name
+                FROM profiles
+            """)
+            row = cursor.fetchone()
+
+        return dict(row)
+
     def update_profile(
         self,
         profile_id: int,
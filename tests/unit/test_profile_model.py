@@ -224,4 +224,33 @@ class TestProfile:
         repr_str = repr(profile)
         assert "Test Profile" in repr_str
         assert "id=1" in repr_str
-        assert "hash=" in repr_str
\ No newline at end of file
+        assert "hash=" in repr_str
+
+    def test_config_dict_cached_until_config_changes(self):
+        """Test parsed configuration is reused until config_json changes."""
+        profile = Profile.create_new("Test", '{"model": "claude-3-opus-20240229"}')
+
+        first = profile.get_config_dict()
+        assert profile.get_config_dict() is first
+
+        profile.config_json = '{"model": "claude-3-sonnet-20240229"}'
+        assert profile.get_model() == "claude-3-sonnet-20240229"
+        assert profile.get_config_dict() is not first
+
+    def test_display_fields_cached_until_config_changes(self):
+        """Test display fields are reused until config_json changes."""
+        config = {
+            "env": {
+                "ANTHROPIC_BASE_URL": "https://api.anthropic.com",
+                "ANTHROPIC_AUTH_TOKEN": "sk-ant-REDACTED"
+            },
+            "model": "claude-3-opus-20240229"
+        }
+        profile = Profile.create_new("Test", json.dumps(config))
+
+        fields = profile.get_display_fields()
+        assert fields == ("https://api.anthropic.com", "sk-ant-a...mnop", "claude-3-opus-20240229")
+        assert profile.get_display_fields() is fields
+
+        profile.update_config('{"model": "claude-3-sonnet-20240229"}')
+        assert profile.get_display_fields() == ("", "", "claude-3-sonnet-20240229")
@@ -184,6 +184,23 @@ class TestValidationService:
         assert "sk-ant-api03-veryl...6789" in masked
         assert "verylongtoken123456789" not in masked
 
+    def test_mask_sensitive_dict(self):
+        """Test masking sensitive values in parsed data."""
+        data = {
+            "env": {
+                "ANTHROPIC_AUTH_TOKEN": "short-token",
+                "ANTHROPIC_BASE_URL": "https://api.example.com/v1?k=sk-abcdefghijklmnopqrstuvwxyz"
+            },
+            "max_tokens": 4096
+        }
+
+        masked = ValidationService.mask_sensitive_dict(data)
+
+        assert masked["env"]["ANTHROPIC_AUTH_TOKEN"] == "short-to..."
+        assert masked["env"]["ANTHROPIC_BASE_URL"] == "https://api.example.com/v1?k=sk-abcde...stuvwxyz"
+        assert masked["max_tokens"] == 4096
+        assert data["env"]["ANTHROPIC_AUTH_TOKEN"] == "short-token"
+
     def test_validate_profile_completeness_complete(self):
         """Test validating complete profile."""
         complete_config = {